@@ -7,6 +7,7 @@ proper validation, SOC management, and power degradation characteristics.
 from __future__ import annotations
 
 from datetime import timedelta
+from functools import lru_cache
 from typing import Any
 
 from elvis.exceptions import (
@@ -28,6 +29,29 @@ from elvis.utility.elvis_general import floor
 class Battery:
     """Models a generic battery."""
 
+    # Slots with a leading underscore hold values derived in __init__
+    __slots__ = (
+        "_deg_floor",
+        "_deg_slope",
+        "_deg_start",
+        "capacity",
+        "efficiency",
+        "max_charge_power",
+        "max_degradation_level",
+        "min_charge_power",
+        "start_power_degradation",
+    )
+
+    # Attributes serialized by to_dict, in constructor order; subclasses list only their own
+    _serialized_fields: tuple[str, ...] = (
+        "capacity",
+        "max_charge_power",
+        "min_charge_power",
+        "efficiency",
+        "start_power_degradation",
+        "max_degradation_level",
+    )
+
     def __init__(
         self,
         capacity: Energy,
@@ -75,13 +99,31 @@ class Battery:
         # max_power_possible * max_degradation_level
         self.max_degradation_level = max_degradation_level
 
+        # fraction of max power lost per unit of SOC above start_power_degradation, so
+        # max_power_possible needs no division (degradation never applies if start == 1)
+        self._deg_start = start_power_degradation
+        self._deg_slope = (
+            (1 - max_degradation_level) / (1 - start_power_degradation)
+            if start_power_degradation < 1
+            else 0.0
+        )
+        # power left at SOC = 1, guards against rounding below the fully degraded level
+        self._deg_floor = max_charge_power * max_degradation_level
+
     def __str__(self) -> str:
         """String representation of the battery."""
         return f"Battery({self.capacity} kWh, {self.max_charge_power} kW, eff={self.efficiency})"
 
     def to_dict(self) -> ConfigDict:
-        """Convert battery to dictionary representation."""
-        dictionary = self.__dict__.copy()
+        """Convert battery to dictionary representation.
+
+        Collects the _serialized_fields of every class along the MRO, subclass fields first.
+        """
+        dictionary = {
+            key: getattr(self, key)
+            for cls in type(self).__mro__
+            for key in cls.__dict__.get("_serialized_fields", ())
+        }
         return dictionary
 
     def max_power_possible(self, current_soc: SOC) -> Power:
@@ -97,16 +139,9 @@ class Battery:
             max_power_possible: (float): Max assignable power.
 
         """
-        if current_soc > self.start_power_degradation:
-            power_degradation = (
-                (current_soc - self.start_power_degradation)
-                / (1 - self.start_power_degradation)
-                * self.max_charge_power
-                * (1 - self.max_degradation_level)
-            )
-
-            max_power_possible = self.max_charge_power - power_degradation
-            return max_power_possible
+        if current_soc > self._deg_start:
+            factor = 1 - (current_soc - self._deg_start) * self._deg_slope
+            return max(self.max_charge_power * factor, self._deg_floor)
 
         return self.max_charge_power
 
@@ -129,9 +164,12 @@ class EVBattery(Battery):
     """Models an electric vehicle battery.
 
     Type-safe implementation of an EV battery with validation
-    and proper error handling.
+    and proper error handling. from_dict hands the same battery to every vehicle type
+    with equal parameters, so batteries built by it are shared and must not be mutated.
     """
 
+    __slots__ = ("_cap_over_eff",)
+
     def __init__(
         self,
         capacity: Energy,
@@ -160,6 +198,10 @@ class EVBattery(Battery):
             capacity = ensure_positive(capacity, "capacity")
             max_charge_power = ensure_positive(max_charge_power, "max_charge_power")
             efficiency = ensure_probability(efficiency, "efficiency")
+            if efficiency == 0:
+                raise InvalidParameterError(
+                    "efficiency", efficiency, "must be greater than 0, it could never charge"
+                )
             start_power_degradation = ensure_probability(
                 start_power_degradation, "start_power_degradation"
             )
@@ -184,10 +226,38 @@ class EVBattery(Battery):
             max_degradation_level,
         )
 
+        # energy drawn per unit of SOC gained when charging (kWh); efficiency is > 0 here
+        self._cap_over_eff = capacity / efficiency
+
+    def __reduce__(self) -> tuple[type[EVBattery], tuple]:
+        """Rebuild copies and pickles through __init__, which also restores cached values."""
+        return type(self), self._parameters()
+
     def __str__(self) -> str:
         """String representation of the EV battery."""
         return f"EVBattery({self.capacity} kWh, {self.max_charge_power} kW, eff={self.efficiency})"
 
+    def _parameters(self) -> tuple:
+        """Constructor parameters, which fully determine an EV battery."""
+        return (
+            self.capacity,
+            self.max_charge_power,
+            self.min_charge_power,
+            self.efficiency,
+            self.start_power_degradation,
+            self.max_degradation_level,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """EV batteries are equal if they are of the same type and have equal parameters."""
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._parameters() == other._parameters()
+
+    def __hash__(self) -> int:
+        """Hash the type and the six constructor parameters that __eq__ compares."""
+        return hash((type(self), self._parameters()))
+
     def energy_for_soc_change(self, current_soc: SOC, target_soc: SOC) -> Energy:
         """Calculate energy needed/released for SOC change.
 
@@ -207,14 +277,16 @@ class EVBattery(Battery):
         if not (0 <= target_soc <= 1):
             raise InvalidSOCError(target_soc)
 
+        if current_soc == target_soc:
+            return 0.0
+
         soc_change = target_soc - current_soc
-        energy_change = soc_change * self.capacity
 
         # Account for efficiency when charging (positive energy change)
-        if energy_change > 0:  # Charging
-            energy_change = energy_change / self.efficiency
+        if soc_change > 0:  # Charging
+            return soc_change * self._cap_over_eff
 
-        return energy_change
+        return soc_change * self.capacity
 
     def time_for_soc_change(
         self, current_soc: SOC, target_soc: SOC, charge_power: Power
@@ -275,7 +347,8 @@ class EVBattery(Battery):
             **kwargs: Additional keyword arguments
 
         Returns:
-            EVBattery instance
+            EVBattery instance, shared with earlier calls using the same parameters, so it
+            must not be mutated
 
         Raises:
             KeyError: If required parameters are missing
@@ -285,6 +358,18 @@ class EVBattery(Battery):
         if data is not None:
             kwargs.update(data)
 
+        parameters = cls._parameters_from_dict(kwargs)
+        # the cache only builds EVBattery itself; subclasses get a new instance every time
+        if cls is not EVBattery:
+            return cls(*parameters)
+        try:
+            return _cached_ev_battery(*parameters)
+        except TypeError:  # unhashable parameter values are built without caching
+            return cls(*parameters)
+
+    @staticmethod
+    def _parameters_from_dict(kwargs: ConfigDict) -> tuple[float, ...]:
+        """Constructor parameters for from_dict, in order, with the optional ones filled in."""
         necessary_keys = ["capacity", "max_charge_power", "min_charge_power", "efficiency"]
 
         for key in necessary_keys:
@@ -308,7 +393,7 @@ class EVBattery(Battery):
         else:
             max_degradation_level = 0.0
 
-        return cls(
+        return (
             capacity,
             max_charge_power,
             min_charge_power,
@@ -318,6 +403,15 @@ class EVBattery(Battery):
         )
 
 
+# Vehicle types are rebuilt for every charging event, so equal configs share one instance.
+# Equal values of different types (50 and 50.0) build batteries with different attribute
+# types, so the cache is typed
+@lru_cache(maxsize=256, typed=True)
+def _cached_ev_battery(*parameters: float) -> EVBattery:
+    """EVBattery for the six constructor parameters resolved by from_dict."""
+    return EVBattery(*parameters)
+
+
 class StationaryBattery(Battery):
     """Models a stationary battery storage system.
 
@@ -325,6 +419,10 @@ class StationaryBattery(Battery):
     operations, and state management for grid-connected storage.
     """
 
+    __slots__ = ("min_soc", "power", "soc", "soc_time")
+
+    _serialized_fields = ("soc", "min_soc", "power", "soc_time")
+
     def __init__(
         self,
         capacity: Energy,
@@ -446,9 +544,9 @@ class StationaryBattery(Battery):
         Todo:
             - integrate efficiencies
         """
-        assert isinstance(power_to_discharge, (float, int)), (
-            "Currently assigned power should be numeric"
-        )
+        assert isinstance(
+            power_to_discharge, (float, int)
+        ), "Currently assigned power should be numeric"
         assert power_to_discharge >= 0, "The max charge power must be >= 0."
 
         # Max power too discharge with at current SOC
@@ -134,9 +134,7 @@ def create_vehicle_arrivals(arrival_distribution, num_charging_events, time_step
     corr_position = time_stamp_to_hours(time_steps)
 
     # Get arrival probablity for each time step of the simulation
-    arrival_probability = []
-    for pos in corr_position:
-        arrival_probability.append(dist[pos])
+    arrival_probability = dist.at(corr_position).tolist()
     # Normalize probability
     cumsum = sum(arrival_probability)
     if cumsum == 0:
@@ -1,9 +1,80 @@
+import bisect
 import math
+from collections.abc import Callable
+from typing import cast
+
+import numpy as np
+import numpy.typing as npt
+
+try:
+    from numba import njit as _numba_njit
+except ImportError:  # numba is an optional accelerator, see the "performance" extra
+    _HAS_NUMBA = False
+else:
+    _HAS_NUMBA = True
+
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+
+# signature of the batch kernels below
+_Kernel = Callable[..., np.ndarray]
+
+
+def _njit(func: _Kernel) -> _Kernel:
+    """Compile func with numba.njit(cache=True), or return it unchanged without numba."""
+    if not _HAS_NUMBA:
+        return func
+    return cast("_Kernel", _numba_njit(cache=True)(func))
+
+
+@_njit
+def _linear_interpolation_batch(x: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """Linearly interpolate the points (xs, ys) at every value of the 1d array x."""
+    out = np.empty_like(x)
+    n = xs.shape[0]
+    for k in range(x.shape[0]):
+        key = x[k]
+        if np.isnan(key):
+            # searchsorted sorts NaN past the last point; keep the scalar lookup's NaN result
+            out[k] = np.nan
+        elif key < xs[0]:
+            out[k] = ys[0]
+        elif key >= xs[n - 1]:
+            out[k] = ys[n - 1]
+        else:
+            i = max(np.searchsorted(xs, key), 1)
+            offset = (key - xs[i - 1]) / (xs[i] - xs[i - 1])
+            out[k] = ys[i - 1] + (ys[i] - ys[i - 1]) * offset
+    return out
+
+
+@_njit
+def _equally_spaced_linear_interpolation_batch(
+    x: np.ndarray, x_first: float, x_last: float, inv_d: float, ys: np.ndarray
+) -> np.ndarray:
+    """Linearly interpolate equally spaced points at every value of the 1d array x."""
+    out = np.empty_like(x)
+    n = ys.shape[0]
+    for k in range(x.shape[0]):
+        key = x[k]
+        if key < x_first:
+            out[k] = ys[0]
+        elif key >= x_last:
+            out[k] = ys[n - 1]
+        else:
+            pos = (key - x_first) * inv_d
+            i = int(pos)
+            if i >= n - 1:
+                out[k] = ys[n - 1]
+            else:
+                out[k] = ys[i] + (ys[i + 1] - ys[i]) * (pos - i)
+    return out
 
 
 class Distribution:
     """Represents a distribution of some x value to a y value."""
 
+    __slots__ = ()
+
     def __getitem__(self, key):
         raise NotImplementedError
 
@@ -13,37 +84,57 @@ class Distribution:
 
     @property
     def min_x(self):
-        return bounds["x"]["min"]
+        return self.bounds["x"]["min"]
 
     @property
     def max_x(self):
-        return bounds["x"]["max"]
+        return self.bounds["x"]["max"]
 
     @property
     def min_y(self):
-        return bounds["y"]["min"]
+        return self.bounds["y"]["min"]
 
     @property
     def max_y(self):
-        return bounds["y"]["max"]
+        return self.bounds["y"]["max"]
 
 
 class NormalDistribution(Distribution):
     """A normal distribution."""
 
+    __slots__ = ("_k", "fac", "mu", "sigma")
+
+    _k: float
+    fac: float
+    mu: float
+    sigma: float
+
     def __init__(self, mu, sigma):
         self.mu = mu
         self.sigma = sigma
 
         # 1 / (sigma*sqrt(2*pi))
-        self.fac = 1.0 / (sigma * math.sqrt(2.0 * math.pi))
+        self.fac = 1.0 / (sigma * _SQRT_2PI)
+
+        # -1 / (2*sigma^2)
+        self._k = -0.5 / (sigma * sigma)
 
     def __getitem__(self, key):
-        # ((x-mu)/sigma)^2
-        exp = math.pow((key - self.mu) / self.sigma, 2.0)
+        # fac * e^(-(x-mu)^2 / (2*sigma^2))
+        d = key - self.mu
+        return self.fac * math.exp(self._k * d * d)
 
-        # fac * e^(-.5*exp)
-        return self.fac * math.exp(-0.5 * exp)
+    def at(self, x: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Evaluate the distribution at every value of an array-like x.
+
+        Args:
+            x: (array_like): Positions to evaluate the distribution at.
+
+        Returns:
+            numpy.ndarray: Values of the distribution, same shape as x.
+        """
+        d = np.asarray(x, dtype=np.float64) - self.mu
+        return self.fac * np.exp(self._k * d * d)
 
     @property
     def bounds(self):
@@ -59,11 +150,24 @@ class NormalDistribution(Distribution):
 class InterpolatedDistribution(Distribution):
     """A distribution that generates new values using some form of interpolation of a set of given points."""
 
+    __slots__ = ("_bounds", "_x_values", "_xs", "_y_values", "_ys", "interpolate")
+
     def __init__(self, points, bounds, interpolate):
-        self.points = points
         self._bounds = bounds
         self.interpolate = interpolate
 
+        # the points are stored as struct-of-arrays, x and y values in two float64 arrays
+        self._xs = np.array([pt[0] for pt in points], dtype=np.float64)
+        self._ys = np.array([pt[1] for pt in points], dtype=np.float64)
+        # bisect on lists of floats is faster than on arrays, so scalar lookups get list views
+        self._x_values = self._xs.tolist()
+        self._y_values = self._ys.tolist()
+
+    @property
+    def points(self):
+        """The (x, y) points the distribution interpolates, rebuilt from the arrays."""
+        return list(zip(self._x_values, self._y_values, strict=True))
+
     @staticmethod
     def linear(points, bounds):
         return InterpolatedDistribution(
@@ -74,26 +178,51 @@ class InterpolatedDistribution(Distribution):
     def _linear_interpolation(y0, y1, offset):
         return y0 + (y1 - y0) * offset
 
+    def at(self, x: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Evaluate the distribution at every value of an array-like x.
+
+        Args:
+            x: (array_like): Positions to evaluate the distribution at.
+
+        Returns:
+            numpy.ndarray: Values of the distribution, same shape as x.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        xs = self._xs
+        ys = self._ys
+
+        # linear interpolation runs as a compiled loop when numba is installed
+        if _HAS_NUMBA and self.interpolate is InterpolatedDistribution._linear_interpolation:
+            return _linear_interpolation_batch(x.ravel(), xs, ys).reshape(x.shape)
+
+        if len(xs) == 1:
+            return np.full(x.shape, ys[0])
+
+        # index of the first point whose x is >= the key, same as the scalar lookup
+        idx = np.clip(np.searchsorted(xs, x, side="left"), 1, len(xs) - 1)
+        x0 = xs[idx - 1]
+        offset = (x - x0) / (xs[idx] - x0)
+        y: npt.NDArray[np.float64] = self.interpolate(ys[idx - 1], ys[idx], offset)
+
+        return np.where(x < xs[0], ys[0], np.where(x >= xs[-1], ys[-1], y))
+
     def __getitem__(self, key):
-        if key < self.points[0][0]:
-            return self.points[0][1]
+        xs = self._x_values
+        ys = self._y_values
 
-        if key >= self.points[-1][0]:
-            return self.points[-1][1]
+        if key < xs[0]:
+            return ys[0]
 
-        # find the closest point we have.
-        min_i = 0
+        if key >= xs[-1]:
+            return ys[-1]
 
-        for i, pt in enumerate(self.points):
-            if pt[0] >= key:
-                min_i = i
-                break
+        # find the closest point we have.
+        i = max(bisect.bisect_left(xs, key), 1)
 
-        p0 = self.points[min_i - 1]
-        p1 = self.points[min_i]
-        offset = (key - p0[0]) / (p1[0] - p0[0])
+        x0 = xs[i - 1]
+        offset = (key - x0) / (xs[i] - x0)
 
-        return self.interpolate(p0[1], p1[1], offset)
+        return self.interpolate(ys[i - 1], ys[i], offset)
 
     @property
     def bounds(self):
@@ -105,12 +234,33 @@ class EquallySpacedInterpolatedDistribution(Distribution):
     whose x values are the same distance apart.
     """
 
+    __slots__ = (
+        "_bounds",
+        "_inv_d",
+        "_n",
+        "_x0",
+        "_x_last",
+        "_y_values",
+        "_ys",
+        "distance_between_points",
+        "interpolate",
+        "points",
+    )
+
     def __init__(self, points, bounds, interpolate):
         self.points = points
         self._bounds = bounds
         self.interpolate = interpolate
         self.distance_between_points = abs(points[1][0] - points[0][0])
 
+        # cached for the direct index calculation in __getitem__ and at
+        self._x0 = points[0][0]
+        self._x_last = points[-1][0]
+        self._inv_d = 1.0 / self.distance_between_points
+        self._y_values = tuple(pt[1] for pt in points)
+        self._ys = np.array(self._y_values, dtype=np.float64)
+        self._n = len(points)
+
     @staticmethod
     def linear(points, bounds):
         return EquallySpacedInterpolatedDistribution(
@@ -122,20 +272,52 @@ class EquallySpacedInterpolatedDistribution(Distribution):
         return y0 + (y1 - y0) * offset
 
     def __getitem__(self, key):
-        if key < self.points[0][0]:
-            return self.points[0][1]
-
-        if key >= self.points[-1][0]:
-            return self.points[-1][1]
-
-        # find the closest point we have.
-        min_i = math.ceil((key - self.points[0][0]) / self.distance_between_points)
-
-        p0 = self.points[min_i - 1]
-        p1 = self.points[min_i]
-        offset = (key - p0[0]) / (p1[0] - p0[0])
+        if key < self._x0:
+            return self._y_values[0]
+
+        if key >= self._x_last:
+            return self._y_values[-1]
+
+        # position of the key in units of the point spacing
+        pos = (key - self._x0) * self._inv_d
+        i = int(pos)
+        if i >= self._n - 1:
+            return self._y_values[-1]
+
+        return self.interpolate(self._y_values[i], self._y_values[i + 1], pos - i)
+
+    def at(self, x: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Evaluate the distribution at every value of an array-like x.
+
+        Args:
+            x: (array_like): Positions to evaluate the distribution at.
+
+        Returns:
+            numpy.ndarray: Values of the distribution, same shape as x.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        ys = self._ys
+
+        # NaN has no position between the points; raise like __getitem__ does
+        if np.isnan(x).any():
+            raise ValueError("cannot interpolate at NaN")
+
+        # linear interpolation runs as a compiled loop when numba is installed
+        if _HAS_NUMBA and self.interpolate is InterpolatedDistribution._linear_interpolation:
+            return _equally_spaced_linear_interpolation_batch(
+                x.ravel(), self._x0, self._x_last, self._inv_d, ys
+            ).reshape(x.shape)
+
+        # clamped so out of range (and infinite) positions give finite offsets; np.where
+        # replaces their results with the end values below
+        pos = np.clip((x - self._x0) * self._inv_d, 0, self._n - 1)
+        i = pos.astype(np.intp)
+        i_next = np.minimum(i + 1, self._n - 1)
+        y: npt.NDArray[np.float64] = np.where(
+            i >= self._n - 1, ys[-1], self.interpolate(ys[i], ys[i_next], pos - i)
+        )
 
-        return self.interpolate(p0[1], p1[1], offset)
+        return np.where(x < self._x0, ys[0], np.where(x >= self._x_last, ys[-1], y))
 
     @property
     def bounds(self):
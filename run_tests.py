@@ -14,6 +14,7 @@ Usage:
     python run_tests.py --fast                    # Run fast tests (exclude slow)
     python run_tests.py --coverage                # Run with detailed coverage
     python run_tests.py --profile                 # Run with profiling
+    python run_tests.py --unit --parallel         # Spread unit tests over all CPUs (pytest-xdist)
 """
 
 import argparse
@@ -26,9 +27,14 @@ from pathlib import Path
 class TestRunner:
     """Manages test execution with different configurations."""
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, parallel: bool = False):
         self.project_root = project_root
         self.test_dir = project_root / "tests"
+        self.parallel = parallel
+
+    def _parallel_args(self) -> list[str]:
+        """pytest-xdist options; whole files go to one worker so module fixtures are reused."""
+        return ["-n", "auto", "--dist", "loadfile"] if self.parallel else []
 
     def run_unit_tests(self, coverage: bool = True, verbose: bool = True) -> int:
         """Run unit tests with optimized settings."""
@@ -51,7 +57,7 @@ class TestRunner:
                 ]
             )
 
-        cmd.extend(["--durations=5", "-m", "not slow"])
+        cmd.extend(["--durations=5", "-m", "not slow", *self._parallel_args()])
 
         print("🧪 Running unit tests...")
         return self._execute_command(cmd)
@@ -95,6 +101,9 @@ class TestRunner:
             "-m",
             "pytest",
             "tests/unit/test_property_based.py",
+            "tests/unit/test_battery_props.py",
+            "tests/unit/test_units_props.py",
+            "tests/unit/test_distribution_props.py",
             "--tb=short",
             "-v" if verbose else "-q",
             "--hypothesis-show-statistics",
@@ -117,6 +126,7 @@ class TestRunner:
             "-m",
             "not slow",
             "--durations=5",
+            *self._parallel_args(),
         ]
 
         if coverage:
@@ -141,7 +151,7 @@ class TestRunner:
                 ]
             )
 
-        cmd.extend(["--durations=10", "--hypothesis-show-statistics"])
+        cmd.extend(["--durations=10", "--hypothesis-show-statistics", "--hypothesis-profile=ci"])
 
         print("🎯 Running comprehensive test suite...")
         return self._execute_command(cmd)
@@ -268,12 +278,17 @@ Examples:
     parser.add_argument("--quiet", "-q", action="store_true", help="Quiet output")
     parser.add_argument("--typecheck", action="store_true", help="Run type checking")
     parser.add_argument("--lint", action="store_true", help="Run code quality checks")
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run unit and fast tests on all CPUs with pytest-xdist",
+    )
 
     args = parser.parse_args()
 
     # Find project root
     project_root = Path(__file__).parent
-    runner = TestRunner(project_root)
+    runner = TestRunner(project_root, parallel=args.parallel)
 
     # Default to fast tests if no specific category selected
     if not any([args.unit, args.integration, args.performance, args.property, args.all]):
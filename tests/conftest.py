@@ -7,6 +7,22 @@ from typing import Any
 
 import pytest
 import yaml
+from hypothesis import HealthCheck, settings
+
+# Keep numba's on-disk JIT cache in the repository so compiled kernels survive across runs
+os.environ.setdefault("NUMBA_CACHE_DIR", str(Path(__file__).parent.parent / ".numba_cache"))
+
+# Hypothesis profiles: "fast" replays a small fixed set of examples for quick local runs,
+# "ci" explores more random examples. Without HYPOTHESIS_PROFILE (or --hypothesis-profile)
+# Hypothesis's randomized default profile is used.
+settings.register_profile(
+    "fast",
+    max_examples=20,
+    derandomize=True,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.register_profile("ci", max_examples=200)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "default"))
 
 
 @pytest.fixture
@@ -119,6 +135,36 @@ def test_data_dir() -> Path:
     return Path(__file__).parent / "fixtures" / "data"
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _warm_hot_paths() -> None:
+    """Exercise hot entry points once so first-call costs aren't billed to the first test.
+
+    Performance tests time these code paths directly. Any kernel that pays a one-off
+    cost on first use (lazy imports, JIT compilation) should be called here. With numba
+    installed the first run compiles into NUMBA_CACHE_DIR; later runs load from that cache.
+    """
+    from elvis.battery import EVBattery
+    from elvis.distribution import EquallySpacedInterpolatedDistribution, InterpolatedDistribution
+
+    battery = EVBattery(
+        capacity=1.0,
+        max_charge_power=1.0,
+        min_charge_power=0.0,
+        efficiency=1.0,
+        start_power_degradation=0.8,
+        max_degradation_level=0.3,
+    )
+    battery.max_power_possible(0.9)
+    battery.min_power_possible(0.9)
+
+    bounds = {"x": {"min": 0, "max": 1}, "y": {"min": 0, "max": 1}}
+    distribution = InterpolatedDistribution.linear([(0, 0), (1, 1)], bounds)
+    distribution[0.5]
+    # compiles the batched interpolation kernels when numba is installed
+    distribution.at([0.5])
+    EquallySpacedInterpolatedDistribution.linear([(0, 0), (1, 1)], bounds).at([0.5])
+
+
 @pytest.fixture(autouse=True)
 def setup_test_environment():
     """Set up test environment for each test."""
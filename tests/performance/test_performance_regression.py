@@ -11,14 +11,19 @@ Focus areas:
 - Algorithm complexity verification
 """
 
+import json
+import numpy as np
 import pytest
 import time
 import psutil
 import os
+import tracemalloc
+import yaml
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List
 
+import elvis
 from elvis.config import ScenarioConfig
 from elvis.simulate import simulate
 from elvis.battery import EVBattery
@@ -26,19 +31,65 @@ from elvis.vehicle import ElectricVehicle
 from elvis.distribution import NormalDistribution, InterpolatedDistribution
 from elvis.config import ScenarioRealisation
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+ELVIS_PACKAGE_DIR = Path(elvis.__file__).parent
+OFFICE_CONFIG_PATH = Path(__file__).parents[2] / "data" / "config_builder" / "office.yaml"
+
+# Handle to the current process, reused by every memory measurement
+_PROC = psutil.Process(os.getpid())
+
+# Vehicle types used by the scenario helpers, serialized once since they never change
+TEST_VEHICLE_DICT = ElectricVehicle(
+    brand="Test",
+    model="Vehicle",
+    battery=EVBattery(
+        capacity=50.0, max_charge_power=150.0, min_charge_power=0.0, efficiency=0.95
+    ),
+    probability=1.0,
+).to_dict()
+SMALL_VEHICLE_DICT = ElectricVehicle(
+    "Test",
+    "Car",
+    EVBattery(capacity=40.0, max_charge_power=100.0, min_charge_power=0.0, efficiency=0.9),
+    1.0,
+).to_dict()
+
+
+@pytest.fixture(scope="module")
+def office_config() -> ScenarioConfig:
+    """Office scenario configuration, parsed once per test module."""
+    with open(OFFICE_CONFIG_PATH) as f:
+        yaml_data = yaml.load(f, Loader=SafeLoader)
+    return ScenarioConfig.from_yaml(yaml_data)
+
 
 class PerformanceMonitor:
     """Context manager for monitoring performance metrics."""
 
-    def __init__(self, test_name: str):
+    def __init__(self, test_name: str, trace_peak: bool = False):
         self.test_name = test_name
         self.start_time = None
         self.end_time = None
         self.start_memory = None
         self.end_memory = None
-        self.process = psutil.Process(os.getpid())
+        self.process = _PROC
+        # tracemalloc slows allocations down, so peak tracing is opt-in
+        self.trace_peak = trace_peak
+        self.started_tracing = False
+        self.start_traced = None
+        self.end_peak_traced = None
 
     def __enter__(self):
+        if self.trace_peak:
+            self.started_tracing = not tracemalloc.is_tracing()
+            if self.started_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self.start_traced = tracemalloc.get_traced_memory()[0]
         self.start_time = time.perf_counter()
         self.start_memory = self.process.memory_info().rss
         return self
@@ -46,6 +97,10 @@ class PerformanceMonitor:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.end_time = time.perf_counter()
         self.end_memory = self.process.memory_info().rss
+        if self.trace_peak:
+            self.end_peak_traced = tracemalloc.get_traced_memory()[1]
+            if self.started_tracing:
+                tracemalloc.stop()
 
     @property
     def duration(self) -> float:
@@ -62,6 +117,17 @@ class PerformanceMonitor:
         """Memory usage change in MB."""
         return self.memory_delta / (1024 * 1024)
 
+    @property
+    def peak_memory_mb(self) -> float:
+        """Peak memory allocated inside the block, above its starting level, in MB.
+
+        Measured with tracemalloc, so it needs ``trace_peak=True``. Unlike the process
+        high-water mark it is reset for every block, so earlier tests cannot hide growth.
+        """
+        if not self.trace_peak:
+            raise RuntimeError("peak memory is only measured with trace_peak=True")
+        return (self.end_peak_traced - self.start_traced) / (1024 * 1024)
+
 
 class TestSimulationPerformance:
     """Performance tests for simulation runtime."""
@@ -129,8 +195,8 @@ class TestSimulationPerformance:
             simulation_hours=720,  # 1 month
         )
 
-        with PerformanceMonitor("large_simulation") as monitor:
-            results = simulate(
+        def run_simulation():
+            return simulate(
                 scenario_config,
                 start_date="2020-01-01 00:00:00",
                 end_date="2020-01-31 00:00:00",
@@ -138,6 +204,12 @@ class TestSimulationPerformance:
                 print_progress=False,
             )
 
+        with PerformanceMonitor("large_simulation") as monitor:
+            run_simulation()
+        # tracemalloc slows the run down, so the peak comes from a second, untimed run
+        with PerformanceMonitor("large_simulation_peak", trace_peak=True) as peak_monitor:
+            run_simulation()
+
         # Performance assertions (stress test thresholds)
         assert monitor.duration < 120.0, (
             f"Large simulation took {monitor.duration:.2f}s (expected < 2min)"
@@ -145,19 +217,18 @@ class TestSimulationPerformance:
         assert monitor.memory_delta_mb < 500.0, (
             f"Memory usage increased by {monitor.memory_delta_mb:.1f}MB (expected < 500MB)"
         )
+        # The end-of-run RSS can hide transient allocations; bound the peak as well
+        assert peak_monitor.peak_memory_mb < 500.0, (
+            f"Peak memory grew by {peak_monitor.peak_memory_mb:.1f}MB (expected < 500MB)"
+        )
 
-        print(f"✅ Large simulation: {monitor.duration:.3f}s, {monitor.memory_delta_mb:.1f}MB")
+        print(
+            f"✅ Large simulation: {monitor.duration:.3f}s, {monitor.memory_delta_mb:.1f}MB, "
+            f"peak +{peak_monitor.peak_memory_mb:.1f}MB"
+        )
 
     def _create_test_scenario(self, num_events: int, simulation_hours: int) -> ScenarioConfig:
         """Create a test scenario with specified parameters."""
-        # Create simple test battery
-        battery = EVBattery(
-            capacity=50.0, max_charge_power=150.0, min_charge_power=0.0, efficiency=0.95
-        )
-
-        # Create simple test vehicle
-        vehicle = ElectricVehicle(brand="Test", model="Vehicle", battery=battery, probability=1.0)
-
         # Create simple arrival distribution (uniform during day)
         arrival_dist = [0.0] * 24  # 24 hours
         for i in range(6, 22):  # Active from 6 AM to 10 PM
@@ -187,7 +258,7 @@ class TestSimulationPerformance:
         # Create scenario configuration
         config_dict = {
             "arrival_distribution": arrival_dist,
-            "vehicle_types": [vehicle.to_dict()],
+            "vehicle_types": [TEST_VEHICLE_DICT],
             "infrastructure": infrastructure,
             "num_charging_events": num_events,
             "scheduling_policy": "uncontrolled",
@@ -210,34 +281,29 @@ class TestConfigurationPerformance:
     @pytest.mark.performance
     def test_config_loading_performance(self):
         """Benchmark configuration loading from YAML."""
-        config_path = Path("data/config_builder/office.yaml")
+        # Read the file once so only parsing and config construction are timed
+        raw = OFFICE_CONFIG_PATH.read_bytes()
 
         with PerformanceMonitor("config_loading") as monitor:
             # Load multiple times to test repeated loading
             for _ in range(10):
-                import yaml
-
-                with open(config_path) as f:
-                    yaml_data = yaml.safe_load(f)
+                yaml_data = yaml.load(raw, Loader=SafeLoader)
                 config = ScenarioConfig.from_yaml(yaml_data)
 
         avg_time = monitor.duration / 10
-        assert avg_time < 0.1, f"Config loading took {avg_time:.4f}s average (expected < 0.1s)"
+        print(f"✅ Config loading: {avg_time:.4f}s average per load with {SafeLoader.__name__}")
 
-        print(f"✅ Config loading: {avg_time:.4f}s average per load")
+        assert avg_time < 0.1, f"Config loading took {avg_time:.4f}s average (expected < 0.1s)"
+        # Losing libyaml makes every config load several times slower; fail instead of skipping
+        assert SafeLoader is not yaml.SafeLoader, (
+            "PyYAML has no libyaml support, config loading fell back to the pure-Python SafeLoader"
+        )
 
     @pytest.mark.performance
-    def test_realisation_creation_performance(self):
+    def test_realisation_creation_performance(self, office_config):
         """Benchmark scenario realisation creation."""
-        # Load office configuration
-        import yaml
-
-        with open("data/config_builder/office.yaml") as f:
-            yaml_data = yaml.safe_load(f)
-        config = ScenarioConfig.from_yaml(yaml_data)
-
         with PerformanceMonitor("realisation_creation") as monitor:
-            realisation = config.create_realisation(
+            realisation = office_config.create_realisation(
                 start_date="2020-01-01 00:00:00",
                 end_date="2020-01-02 00:00:00",
                 resolution="01:00:00",
@@ -305,8 +371,8 @@ class TestAlgorithmComplexity:
 
             dist = InterpolatedDistribution.linear(points, bounds)
 
-            # Test interpolation performance
-            test_values = [i * 0.1 for i in range(0, count * 10)]  # 10x more test points
+            # Pre-bind query inputs outside the timed region (10x more test points)
+            test_values = (np.arange(count * 10, dtype=np.float64) * 0.1).tolist()
 
             with PerformanceMonitor(f"interpolation_{count}") as monitor:
                 for x in test_values:
@@ -322,6 +388,35 @@ class TestAlgorithmComplexity:
             f"Interpolation doesn't scale well: {times[2] / times[0]:.1f}x slowdown"
         )
 
+    @pytest.mark.performance
+    def test_distribution_batch_interpolation_scaling(self):
+        """Test that batch interpolation with at() scales correctly with data points."""
+        point_counts = [10, 100, 1000]
+        times = []
+
+        for count in point_counts:
+            points = [(i, i * 0.5) for i in range(count)]
+            bounds = {"x": {"min": 0, "max": count - 1}, "y": {"min": 0, "max": (count - 1) * 0.5}}
+
+            dist = InterpolatedDistribution.linear(points, bounds)
+
+            test_values = np.arange(count * 10, dtype=np.float64) * 0.1
+            # With numba installed the first call compiles the kernel; keep that out of the timing
+            dist.at(test_values[:1])
+
+            with PerformanceMonitor(f"batch_interpolation_{count}") as monitor:
+                _ = dist.at(test_values)
+
+            times.append(monitor.duration)
+            print(
+                f"✅ Batch interpolation: {count} points, {len(test_values)} queries in {monitor.duration:.4f}s"
+            )
+
+        # Batch interpolation should scale better than quadratic as well
+        assert times[2] < times[0] * 200, (
+            f"Batch interpolation doesn't scale well: {times[2] / times[0]:.1f}x slowdown"
+        )
+
 
 class TestMemoryUsage:
     """Tests for memory usage patterns and memory leaks."""
@@ -329,7 +424,7 @@ class TestMemoryUsage:
     @pytest.mark.performance
     def test_simulation_memory_cleanup(self):
         """Test that simulations clean up memory properly."""
-        initial_memory = psutil.Process(os.getpid()).memory_info().rss
+        initial_memory = _PROC.memory_info().rss
 
         # Run multiple simulations
         for i in range(5):
@@ -347,7 +442,7 @@ class TestMemoryUsage:
             del results
             del scenario_config
 
-        final_memory = psutil.Process(os.getpid()).memory_info().rss
+        final_memory = _PROC.memory_info().rss
         memory_growth = (final_memory - initial_memory) / (1024 * 1024)  # MB
 
         # Allow some memory growth but not excessive
@@ -361,15 +456,28 @@ class TestMemoryUsage:
     def test_configuration_object_memory(self):
         """Test memory usage of configuration objects."""
         configs = []
-        initial_memory = psutil.Process(os.getpid()).memory_info().rss
-
-        # Create many configuration objects
-        for i in range(100):
-            config = self._create_small_scenario()
-            configs.append(config)
-
-        loaded_memory = psutil.Process(os.getpid()).memory_info().rss
-        memory_per_config = (loaded_memory - initial_memory) / (100 * 1024)  # KB per config
+        # Trace Python heap allocations instead of RSS to avoid page/arena noise
+        tracemalloc.start(25)
+        try:
+            initial_snapshot = tracemalloc.take_snapshot()
+
+            # Create many configuration objects
+            for i in range(100):
+                config = self._create_small_scenario()
+                configs.append(config)
+
+            loaded_snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        # Count allocations with an elvis frame anywhere in their stack, so stdlib calls made
+        # on behalf of elvis count too; the 25-frame traces started above make that possible
+        elvis_filter = [tracemalloc.Filter(True, str(ELVIS_PACKAGE_DIR / "*"), all_frames=True)]
+        stats = loaded_snapshot.filter_traces(elvis_filter).compare_to(
+            initial_snapshot.filter_traces(elvis_filter), "lineno"
+        )
+        memory_growth = sum(stat.size_diff for stat in stats)
+        memory_per_config = memory_growth / (100 * 1024)  # KB per config
 
         assert memory_per_config < 500.0, (
             f"Each config uses {memory_per_config:.1f}KB (expected < 500KB)"
@@ -382,14 +490,9 @@ class TestMemoryUsage:
 
     def _create_small_scenario(self) -> ScenarioConfig:
         """Create a minimal scenario for memory testing."""
-        battery = EVBattery(
-            capacity=40.0, max_charge_power=100.0, min_charge_power=0.0, efficiency=0.9
-        )
-        vehicle = ElectricVehicle("Test", "Car", battery, 1.0)
-
         config_dict = {
             "arrival_distribution": [0.1] * 24,
-            "vehicle_types": [vehicle.to_dict()],
+            "vehicle_types": [SMALL_VEHICLE_DICT],
             "infrastructure": {
                 "transformers": [
                     {
@@ -427,45 +530,58 @@ class TestMemoryUsage:
 class TestPerformanceRegression:
     """Regression tests that compare against performance baselines."""
 
-    BASELINE_FILE = Path("tests/performance/baselines.json")
+    BASELINE_FILE = Path(__file__).parent / "baselines.json"
+    # A one-day office run takes milliseconds, so the fastest of several runs is compared
+    SIMULATION_REPEATS = 3
 
     @pytest.mark.performance
-    def test_office_scenario_regression(self):
+    def test_office_scenario_regression(self, office_config):
         """Regression test against office scenario baseline."""
-        import yaml
-
-        with open("data/config_builder/office.yaml") as f:
-            yaml_data = yaml.safe_load(f)
-        config = ScenarioConfig.from_yaml(yaml_data)
 
-        with PerformanceMonitor("office_regression") as monitor:
-            results = simulate(
-                config,
+        def run_simulation():
+            return simulate(
+                office_config,
                 start_date="2020-01-01 00:00:00",
                 end_date="2020-01-01 23:00:00",
                 resolution="01:00:00",
                 print_progress=False,
             )
 
+        # memory is taken from the first run; later runs reuse memory the first one freed.
+        # The last run is traced for the peak and, as tracemalloc slows it down, not timed
+        monitors = []
+        for i in range(self.SIMULATION_REPEATS):
+            traced = i == self.SIMULATION_REPEATS - 1
+            with PerformanceMonitor("office_regression", trace_peak=traced) as monitor:
+                run_simulation()
+            monitors.append(monitor)
+        duration = min(m.duration for m in monitors[:-1])
+        memory_delta_mb = monitors[0].memory_delta_mb
+        peak_memory_mb = monitors[-1].peak_memory_mb
+
         # Load or create baseline
         baseline = self._load_baseline("office_scenario")
         if baseline is None:
             # First run - establish baseline
             self._save_baseline(
                 "office_scenario",
-                {"duration": monitor.duration, "memory_mb": monitor.memory_delta_mb},
+                {
+                    "duration": duration,
+                    "memory_mb": memory_delta_mb,
+                    "peak_memory_mb": peak_memory_mb,
+                },
             )
             print(
-                f"📊 Office scenario baseline established: {monitor.duration:.3f}s, {monitor.memory_delta_mb:.1f}MB"
+                f"📊 Office scenario baseline established: {duration:.3f}s, {memory_delta_mb:.1f}MB"
             )
         else:
             # Compare against baseline (allow 50% regression)
-            duration_ratio = monitor.duration / baseline["duration"]
-            memory_ratio = (
-                abs(monitor.memory_delta_mb) / abs(baseline["memory_mb"])
-                if baseline["memory_mb"] != 0
-                else 1.0
-            )
+            duration_ratio = duration / baseline["duration"]
+            # A negative delta means memory was released; treat it as zero growth so a
+            # baseline release followed by a leak cannot produce a small ratio
+            baseline_mem = max(baseline["memory_mb"], 0.0)
+            current_mem = max(memory_delta_mb, 0.0)
+            memory_ratio = current_mem / (baseline_mem + 1.0)
 
             assert duration_ratio < 1.5, (
                 f"Performance regression: {duration_ratio:.1f}x slower than baseline"
@@ -473,18 +589,78 @@ class TestPerformanceRegression:
             assert memory_ratio < 2.0, (
                 f"Memory regression: {memory_ratio:.1f}x more memory than baseline"
             )
+            # Baselines recorded before peak tracing have no peak to compare against
+            baseline_peak = baseline.get("peak_memory_mb")
+            if baseline_peak is not None:
+                peak_ratio = peak_memory_mb / (baseline_peak + 1.0)
+                assert peak_ratio < 2.0, (
+                    f"Peak memory regression: {peak_ratio:.1f}x higher peak than baseline"
+                )
 
             print(
                 f"✅ Office scenario regression test passed: {duration_ratio:.2f}x time, {memory_ratio:.2f}x memory"
             )
 
+    # Enough calls that the measured time is well above timer resolution; the fastest of
+    # several repeats is compared, which filters out scheduler noise on shared CI machines
+    CONSTRUCTION_ITERATIONS = 10_000
+    CONSTRUCTION_REPEATS = 3
+
+    @pytest.mark.performance
+    def test_battery_construction_regression(self):
+        """Regression test for EVBattery construction, including parameter validation."""
+        durations = []
+        for _ in range(self.CONSTRUCTION_REPEATS):
+            with PerformanceMonitor("battery_construction") as monitor:
+                for _ in range(self.CONSTRUCTION_ITERATIONS):
+                    EVBattery(
+                        capacity=50.0, max_charge_power=150.0, min_charge_power=0.0, efficiency=0.95
+                    )
+            durations.append(monitor.duration)
+
+        self._check_duration_regression("battery_construction", min(durations))
+
+    @pytest.mark.performance
+    def test_vehicle_from_dict_regression(self):
+        """Regression test for ElectricVehicle.from_dict, which also builds the battery."""
+        # A distinct capacity per call; the cache holds far fewer entries than there are
+        # calls, so no call, in any repeat, is served by from_dict's battery cache
+        batteries = [
+            {**TEST_VEHICLE_DICT["battery"], "capacity": 40.0 + i}
+            for i in range(self.CONSTRUCTION_ITERATIONS)
+        ]
+
+        durations = []
+        for _ in range(self.CONSTRUCTION_REPEATS):
+            with PerformanceMonitor("vehicle_from_dict") as monitor:
+                for battery in batteries:
+                    ElectricVehicle.from_dict(
+                        brand="X", model="Y", probability=0.1, battery=battery
+                    )
+            durations.append(monitor.duration)
+
+        self._check_duration_regression("vehicle_from_dict", min(durations))
+
+    def _check_duration_regression(self, test_name: str, duration: float) -> None:
+        """Compare a duration against its baseline (allow 50% regression), or record it."""
+        baseline = self._load_baseline(test_name)
+        if baseline is None:
+            self._save_baseline(test_name, {"duration": duration})
+            print(f"📊 {test_name} baseline established: {duration:.3f}s")
+            return
+
+        duration_ratio = duration / baseline["duration"]
+        assert duration_ratio < 1.5, (
+            f"Performance regression: {duration_ratio:.1f}x slower than baseline"
+        )
+
+        print(f"✅ {test_name} regression test passed: {duration_ratio:.2f}x time")
+
     def _load_baseline(self, test_name: str) -> Dict[str, Any]:
         """Load baseline performance data."""
         if not self.BASELINE_FILE.exists():
             return None
 
-        import json
-
         try:
             with open(self.BASELINE_FILE) as f:
                 baselines = json.load(f)
@@ -507,8 +683,6 @@ class TestPerformanceRegression:
         # Ensure directory exists
         self.BASELINE_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-        import json
-
         with open(self.BASELINE_FILE, "w") as f:
             json.dump(baselines, f, indent=2)
 
@@ -0,0 +1,152 @@
+"""Shared Hypothesis strategies and cached factories for the property-based tests."""
+
+import random
+from functools import lru_cache
+
+import numpy as np
+from hypothesis import assume, strategies as st, settings
+from hypothesis.strategies import composite
+
+from elvis.battery import EVBattery
+from elvis.distribution import NormalDistribution
+
+# Custom strategies for domain-specific values, built once at import time
+# Valid SOC values between 0 and 1
+soc_values = st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False)
+
+# Positive energy values (kWh)
+positive_energy = st.floats(min_value=0.1, max_value=1000.0, allow_nan=False, allow_infinity=False)
+
+# Positive power values (kW)
+positive_power = st.floats(min_value=0.1, max_value=500.0, allow_nan=False, allow_infinity=False)
+
+# Valid efficiency values between 0 and 1
+efficiency_values = st.floats(min_value=0.01, max_value=1.0, allow_nan=False, allow_infinity=False)
+
+# Valid probability values between 0 and 1
+probability_values = st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False)
+
+# (start_soc, end_soc) pairs that always differ: the end is the start shifted by less than a
+# full turn around [0, 1), so no example has to be rejected
+distinct_soc_pairs = st.tuples(
+    soc_values,
+    st.floats(min_value=1e-9, max_value=1.0 - 1e-9, allow_nan=False, allow_infinity=False),
+).map(lambda pair: (pair[0], (pair[0] + pair[1]) % 1.0))
+
+
+# No deadline, so a slow first example (imports, warm-up) is not reported as a failure; the
+# number of examples comes from the active profile registered in tests/conftest.py
+unit_settings = settings(deadline=None)
+
+
+@composite
+def battery_params(draw):
+    """Generate valid battery parameter combinations."""
+    capacity = draw(positive_energy)
+    max_power = draw(positive_power)
+    efficiency = draw(efficiency_values)
+    start_degradation = draw(probability_values)
+    max_degradation = draw(probability_values)
+    # Even fully degraded, the battery must still be able to take min_charge_power
+    min_power = draw(
+        st.floats(
+            min_value=0.0,
+            max_value=max_degradation * max_power,
+            allow_nan=False,
+            allow_infinity=False,
+        )
+    )
+
+    return {
+        "capacity": capacity,
+        "max_charge_power": max_power,
+        "min_charge_power": min_power,
+        "efficiency": efficiency,
+        "start_power_degradation": start_degradation,
+        "max_degradation_level": max_degradation,
+    }
+
+
+@composite
+def interp_points(draw):
+    """Generate sorted, distinct interpolation points with their bounds."""
+    num_points = draw(st.integers(min_value=2, max_value=10))
+    # Draw a few spare values and sort and dedupe them in one go instead of letting
+    # Hypothesis filter for uniqueness while generating
+    raw_x = draw(
+        st.lists(
+            st.floats(min_value=-100, max_value=100, allow_nan=False, allow_infinity=False),
+            min_size=num_points,
+            max_size=num_points * 2,
+        )
+    )
+    x_values = np.unique(raw_x)[:num_points]
+    assume(x_values.size == num_points)
+    x_values = x_values.tolist()
+    y_values = draw(
+        st.lists(
+            st.floats(min_value=-50, max_value=50, allow_nan=False, allow_infinity=False),
+            min_size=num_points,
+            max_size=num_points,
+        )
+    )
+
+    points = list(zip(x_values, y_values))
+    bounds = {
+        "x": {"min": min(x_values), "max": max(x_values)},
+        "y": {"min": min(y_values), "max": max(y_values)},
+    }
+    return points, bounds
+
+
+@lru_cache(maxsize=4096)
+def _make_battery(
+    capacity,
+    max_charge_power,
+    min_charge_power,
+    efficiency,
+    start_power_degradation,
+    max_degradation_level,
+):
+    """Build an EVBattery, reusing the instance when Hypothesis replays a parameter set.
+
+    The returned battery is shared between examples and must not be mutated.
+    """
+    return EVBattery(
+        capacity,
+        max_charge_power,
+        min_charge_power,
+        efficiency,
+        start_power_degradation,
+        max_degradation_level,
+    )
+
+
+def _pool_params(seed):
+    """Draw battery parameters from the same domain as battery_params with a seeded RNG."""
+    rng = random.Random(seed)
+    max_power = rng.uniform(0.1, 500.0)
+    max_degradation = rng.random()
+
+    return {
+        "capacity": rng.uniform(0.1, 1000.0),
+        "max_charge_power": max_power,
+        "min_charge_power": rng.uniform(0.0, max_degradation * max_power),
+        "efficiency": rng.uniform(0.01, 1.0),
+        "start_power_degradation": rng.random(),
+        "max_degradation_level": max_degradation,
+    }
+
+
+# Fixed batteries built once per run; boundary specs first, then seeded random ones
+BATTERY_POOL = (
+    _make_battery(100.0, 50.0, 0.0, 1.0, 1.0, 0.0),  # no degradation
+    _make_battery(100.0, 50.0, 0.0, 1.0, 0.0, 0.0),  # degrades to zero over the full range
+    _make_battery(100.0, 50.0, 50.0, 1.0, 0.5, 1.0),  # min == max power, no power loss
+    *(_make_battery(**_pool_params(seed)) for seed in range(253)),
+)
+battery_pool_indices = st.integers(min_value=0, max_value=len(BATTERY_POOL) - 1)
+
+
+# Distributions are immutable once built, so replayed (mu, sigma) examples can share one
+_normal_distribution = lru_cache(maxsize=2048)(NormalDistribution)
@@ -0,0 +1,95 @@
+"""Lightweight test doubles for the simulation loop tests.
+
+The stubs expose only the methods the simulation loop calls and record each call
+as a ``(method_name, *args)`` tuple in ``calls``.
+"""
+
+import datetime
+from dataclasses import dataclass, field
+
+
+class StubChargingPoint:
+    """Stand-in for :obj: `charging_point.ChargingPoint`."""
+
+    __slots__ = ("calls", "connected_vehicle")
+
+    def __init__(self, connected_vehicle=None):
+        self.calls = []
+        self.connected_vehicle = connected_vehicle
+
+    def connect_vehicle(self, event):
+        self.calls.append(("connect_vehicle", event))
+
+    def disconnect_vehicle(self):
+        self.calls.append(("disconnect_vehicle",))
+
+    def charge_vehicle(self, power, resolution):
+        self.calls.append(("charge_vehicle", power, resolution))
+
+
+class StubWaitingQueue:
+    """Stand-in for :obj: `waiting_queue.WaitingQueue` backed by a plain list."""
+
+    __slots__ = ("calls", "queue", "maxsize", "next_leave")
+
+    def __init__(self, maxsize=0, queue=None, next_leave=datetime.datetime(9999, 1, 1)):
+        self.calls = []
+        self.queue = [] if queue is None else list(queue)
+        self.maxsize = maxsize
+        self.next_leave = next_leave
+
+    def enqueue(self, item):
+        self.calls.append(("enqueue", item))
+        self.queue.append(item)
+
+    def dequeue(self):
+        self.calls.append(("dequeue",))
+        return self.queue.pop(0) if self.queue else None
+
+    def size(self):
+        return len(self.queue)
+
+    def empty(self):
+        self.calls.append(("empty",))
+        self.queue = []
+
+    def determine_next_leaving_time(self):
+        self.calls.append(("determine_next_leaving_time",))
+
+
+@dataclass(eq=False)
+class StubTransformer:
+    """Stand-in for the transformer returned by a storage system's get_transformer()."""
+
+    max_power: float
+    calls: list = field(default_factory=list)
+
+    def max_hardware_power(self, power_assigned, preload):
+        self.calls.append(("max_hardware_power", power_assigned, preload))
+        return self.max_power
+
+
+@dataclass(eq=False)
+class StubStorage:
+    """Stand-in for a stationary battery; charge() realises ``return_charge``."""
+
+    return_charge: float = 0.0
+    calls: list = field(default_factory=list)
+
+    def charge(self, available_power, step_length):
+        self.calls.append(("charge", available_power, step_length))
+        return self.return_charge
+
+    def discharge(self, power_to_discharge, step_length):
+        self.calls.append(("discharge", power_to_discharge, step_length))
+
+
+@dataclass(eq=False)
+class StubStorageSystem:
+    """Stand-in for a storage system; hashed by identity so it can key assign_power."""
+
+    storage: StubStorage
+    transformer: StubTransformer
+
+    def get_transformer(self):
+        return self.transformer
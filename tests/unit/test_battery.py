@@ -7,6 +7,7 @@ Test coverage for Battery and EVBattery classes including:
 - Edge cases and error handling
 """
 
+
 import pytest
 from datetime import timedelta
 from unittest.mock import MagicMock
@@ -16,6 +17,43 @@ from elvis.exceptions import InvalidParameterError, InvalidSOCError
 from elvis.types import SOC, Energy, Power, Efficiency
 
 
+@pytest.fixture(scope="module")
+def default_ev_battery():
+    """100 kWh EVBattery with perfect efficiency and no power degradation."""
+    return EVBattery(
+        capacity=100.0,
+        max_charge_power=200.0,
+        min_charge_power=0.0,
+        efficiency=1.0,  # Perfect efficiency for easier testing
+    )
+
+
+@pytest.fixture(scope="module")
+def degrading_ev_battery():
+    """100 kWh EVBattery whose max power degrades by up to 50% above 80% SOC."""
+    return EVBattery(
+        capacity=100.0,
+        max_charge_power=200.0,
+        min_charge_power=0.0,
+        efficiency=1.0,
+        start_power_degradation=0.8,  # Degradation starts at 80% SOC
+        max_degradation_level=0.5,  # 50% power reduction at high SOC
+    )
+
+
+@pytest.fixture
+def ev_battery_and_params(request):
+    """EVBattery built from a (capacity, max power, min power, efficiency) tuple, with the tuple."""
+    capacity, max_power, min_power, efficiency = request.param
+    battery = EVBattery(
+        capacity=capacity,
+        max_charge_power=max_power,
+        min_charge_power=min_power,
+        efficiency=efficiency,
+    )
+    return battery, request.param
+
+
 class TestBattery:
     """Test cases for the base Battery class."""
 
@@ -37,51 +75,29 @@ class TestBattery:
         assert battery.start_power_degradation == 0.8
         assert battery.max_degradation_level == 0.1
 
-    def test_battery_initialization_invalid_capacity(self):
-        """Test battery initialization fails with invalid capacity."""
-        with pytest.raises(AssertionError, match="Battery capacity must be greater than 0"):
-            Battery(capacity=0, max_charge_power=150.0, min_charge_power=0.0, efficiency=0.95)
-
-        with pytest.raises(AssertionError, match="Battery capacity must be greater than 0"):
-            Battery(capacity=-10.0, max_charge_power=150.0, min_charge_power=0.0, efficiency=0.95)
-
-    def test_battery_initialization_invalid_efficiency(self):
-        """Test battery initialization fails with invalid efficiency."""
-        with pytest.raises(AssertionError):
-            Battery(
-                capacity=50.0,
-                max_charge_power=150.0,
-                min_charge_power=0.0,
-                efficiency=1.5,  # > 1
-            )
-
-        with pytest.raises(AssertionError):
-            Battery(
-                capacity=50.0,
-                max_charge_power=150.0,
-                min_charge_power=0.0,
-                efficiency=-0.1,  # < 0
-            )
-
-    def test_battery_initialization_invalid_degradation(self):
-        """Test battery initialization fails with invalid degradation parameters."""
-        with pytest.raises(AssertionError):
-            Battery(
-                capacity=50.0,
-                max_charge_power=150.0,
-                min_charge_power=0.0,
-                efficiency=0.95,
-                start_power_degradation=1.5,  # > 1
-            )
-
-        with pytest.raises(AssertionError):
-            Battery(
-                capacity=50.0,
-                max_charge_power=150.0,
-                min_charge_power=0.0,
-                efficiency=0.95,
-                max_degradation_level=1.5,  # > 1
-            )
+    @pytest.mark.parametrize(
+        "kwargs,match",
+        [
+            ({"capacity": 0}, "Battery capacity must be greater than 0"),
+            ({"capacity": -10.0}, "Battery capacity must be greater than 0"),
+            ({"efficiency": 1.5}, None),  # > 1
+            ({"efficiency": -0.1}, None),  # < 0
+            ({"start_power_degradation": 1.5}, None),  # > 1
+            ({"max_degradation_level": 1.5}, None),  # > 1
+        ],
+    )
+    def test_battery_initialization_invalid(self, kwargs, match):
+        """Test battery initialization fails when a single parameter is invalid."""
+        params = {
+            "capacity": 50.0,
+            "max_charge_power": 150.0,
+            "min_charge_power": 0.0,
+            "efficiency": 0.95,
+            **kwargs,
+        }
+
+        with pytest.raises(AssertionError, match=match):
+            Battery(**params)
 
     def test_battery_string_representation(self):
         """Test battery string representation."""
@@ -93,6 +109,44 @@ class TestBattery:
         assert "50.0 kWh" in str_repr
         assert "150.0 kW" in str_repr
 
+    def test_battery_to_dict_only_public_parameters(self):
+        """Test that to_dict serializes the parameters in constructor order, without internals."""
+        battery = Battery(
+            capacity=50.0,
+            max_charge_power=150.0,
+            min_charge_power=0.0,
+            efficiency=0.95,
+            start_power_degradation=0.8,
+            max_degradation_level=0.1,
+        )
+
+        assert battery.to_dict() == {
+            "capacity": 50.0,
+            "max_charge_power": 150.0,
+            "min_charge_power": 0.0,
+            "efficiency": 0.95,
+            "start_power_degradation": 0.8,
+            "max_degradation_level": 0.1,
+        }
+        assert list(battery.to_dict()) == [
+            "capacity",
+            "max_charge_power",
+            "min_charge_power",
+            "efficiency",
+            "start_power_degradation",
+            "max_degradation_level",
+        ]
+
+    def test_battery_uses_slots(self):
+        """Test that batteries store their attributes in slots rather than an instance dict."""
+        battery = Battery(
+            capacity=50.0, max_charge_power=100.0, min_charge_power=0.0, efficiency=1.0
+        )
+        assert not hasattr(battery, "__dict__")
+
+        with pytest.raises(AttributeError):
+            battery.unknown_attribute = 1.0
+
 
 class TestEVBattery:
     """Test cases for the EVBattery class."""
@@ -127,6 +181,53 @@ class TestEVBattery:
         assert ev_battery.min_charge_power == 5.0
         assert ev_battery.efficiency == 0.95
 
+    def test_evbattery_equality(self):
+        """Test that EV batteries compare and hash by their parameters."""
+        params = {
+            "capacity": 60.0,
+            "max_charge_power": 200.0,
+            "min_charge_power": 0.0,
+            "efficiency": 0.95,
+        }
+
+        battery = EVBattery(**params)
+
+        assert battery == EVBattery(**params)
+        assert hash(battery) == hash(EVBattery(**params))
+        assert battery != EVBattery(**{**params, "efficiency": 0.9})
+        assert battery != Battery(**params)
+
+    def test_evbattery_from_dict_reuses_instances(self):
+        """Test that equal configurations share one EVBattery and different ones do not."""
+        config_dict = {
+            "capacity": 60.0,
+            "max_charge_power": 200.0,
+            "min_charge_power": 5.0,
+            "efficiency": 0.95,
+        }
+
+        ev_battery = EVBattery.from_dict(config_dict)
+
+        assert EVBattery.from_dict(dict(reversed(config_dict.items()))) is ev_battery
+        assert EVBattery.from_dict(**config_dict) is ev_battery
+        assert EVBattery.from_dict({**config_dict, "efficiency": 0.9}) is not ev_battery
+
+    def test_evbattery_from_dict_keeps_parameter_types(self):
+        """Test that equal values of different types do not share a cached EVBattery."""
+        config_dict = {
+            "capacity": 70,
+            "max_charge_power": 110,
+            "min_charge_power": 0,
+            "efficiency": 1,
+        }
+
+        int_battery = EVBattery.from_dict(config_dict)
+        float_battery = EVBattery.from_dict({key: float(v) for key, v in config_dict.items()})
+
+        assert float_battery is not int_battery
+        assert type(int_battery.capacity) is int
+        assert type(float_battery.capacity) is float
+
     def test_evbattery_from_dict_missing_required(self):
         """Test EVBattery creation fails with missing required fields."""
         incomplete_dict = {
@@ -150,28 +251,21 @@ class TestEVBattery:
         with pytest.raises(InvalidParameterError):
             EVBattery.from_dict(invalid_dict)
 
-    def test_evbattery_energy_for_soc_change_valid(self):
+    def test_evbattery_energy_for_soc_change_valid(self, default_ev_battery):
         """Test energy calculation for SOC change."""
-        ev_battery = EVBattery(
-            capacity=100.0,
-            max_charge_power=200.0,
-            min_charge_power=0.0,
-            efficiency=1.0,  # Perfect efficiency for easier testing
-        )
+        ev_battery = default_ev_battery
 
         # Test SOC increase (charging)
         energy_needed = ev_battery.energy_for_soc_change(current_soc=0.2, target_soc=0.8)
-        assert abs(energy_needed - 60.0) < 1e-10  # 0.6 * 100 kWh
+        assert energy_needed == pytest.approx(60.0, abs=1e-10)  # 0.6 * 100 kWh
 
         # Test SOC decrease (discharging)
         energy_released = ev_battery.energy_for_soc_change(current_soc=0.8, target_soc=0.2)
-        assert abs(energy_released - (-60.0)) < 1e-10  # Negative for discharge
+        assert energy_released == pytest.approx(-60.0, abs=1e-10)  # Negative for discharge
 
-    def test_evbattery_energy_for_soc_change_invalid_soc(self):
+    def test_evbattery_energy_for_soc_change_invalid_soc(self, default_ev_battery):
         """Test energy calculation fails with invalid SOC values."""
-        ev_battery = EVBattery(
-            capacity=100.0, max_charge_power=200.0, min_charge_power=0.0, efficiency=1.0
-        )
+        ev_battery = default_ev_battery
 
         # Test invalid current SOC
         with pytest.raises(InvalidSOCError):
@@ -187,11 +281,9 @@ class TestEVBattery:
         with pytest.raises(InvalidSOCError):
             ev_battery.energy_for_soc_change(current_soc=0.5, target_soc=1.1)
 
-    def test_evbattery_time_for_soc_change_valid(self):
+    def test_evbattery_time_for_soc_change_valid(self, default_ev_battery):
         """Test time calculation for SOC change at given power."""
-        ev_battery = EVBattery(
-            capacity=100.0, max_charge_power=200.0, min_charge_power=0.0, efficiency=1.0
-        )
+        ev_battery = default_ev_battery
 
         # Test charging time
         time_needed = ev_battery.time_for_soc_change(
@@ -199,27 +291,35 @@ class TestEVBattery:
         )
         # 60 kWh / 50 kW = 1.2 hours
         expected_time = timedelta(hours=1.2)
-        assert abs(time_needed.total_seconds() - expected_time.total_seconds()) < 1
+        assert time_needed.total_seconds() == pytest.approx(expected_time.total_seconds(), abs=1)
 
-    def test_evbattery_time_for_soc_change_zero_power(self):
-        """Test time calculation with zero power (should be infinite/error)."""
+    @pytest.mark.parametrize("current_soc,target_soc", [(0.3, 0.8), (0.8, 0.3), (0.5, 0.5)])
+    def test_evbattery_time_for_soc_change_matches_energy(self, current_soc, target_soc):
+        """Test time calculation agrees with the efficiency-adjusted energy for the SOC change."""
         ev_battery = EVBattery(
-            capacity=100.0, max_charge_power=200.0, min_charge_power=0.0, efficiency=1.0
+            capacity=100.0, max_charge_power=200.0, min_charge_power=0.0, efficiency=0.9
         )
 
+        time_needed = ev_battery.time_for_soc_change(current_soc, target_soc, charge_power=50.0)
+        energy = ev_battery.energy_for_soc_change(current_soc, target_soc)
+
+        assert time_needed.total_seconds() / 3600 == pytest.approx(abs(energy) / 50.0)
+
+    def test_evbattery_zero_efficiency_rejected(self):
+        """Test a battery that could never charge is rejected at construction."""
+        with pytest.raises(InvalidParameterError, match="efficiency"):
+            EVBattery(capacity=100.0, max_charge_power=200.0, min_charge_power=0.0, efficiency=0.0)
+
+    def test_evbattery_time_for_soc_change_zero_power(self, default_ev_battery):
+        """Test time calculation with zero power (should be infinite/error)."""
+        ev_battery = default_ev_battery
+
         with pytest.raises(InvalidParameterError):
             ev_battery.time_for_soc_change(current_soc=0.2, target_soc=0.8, charge_power=0.0)
 
-    def test_evbattery_max_power_at_soc_degradation(self):
+    def test_evbattery_max_power_at_soc_degradation(self, degrading_ev_battery):
         """Test max power calculation with degradation effects."""
-        ev_battery = EVBattery(
-            capacity=100.0,
-            max_charge_power=200.0,
-            min_charge_power=0.0,
-            efficiency=1.0,
-            start_power_degradation=0.8,  # Degradation starts at 80% SOC
-            max_degradation_level=0.5,  # 50% power reduction at high SOC
-        )
+        ev_battery = degrading_ev_battery
 
         # At low SOC, no degradation
         max_power_low = ev_battery.max_power_at_soc(soc=0.5)
@@ -234,7 +334,7 @@ class TestEVBattery:
         # Linear interpolation: 0.9 is halfway between 0.8 and 1.0
         # So degradation is 0.5 * 0.5 = 0.25 (25% reduction)
         expected_power = 200.0 * (1 - 0.25)
-        assert abs(max_power_high - expected_power) < 0.1
+        assert max_power_high == pytest.approx(expected_power, abs=0.1)
 
     def test_evbattery_power_clamping(self):
         """Test power values are clamped to battery limits."""
@@ -255,24 +355,18 @@ class TestEVBattery:
         assert clamped_valid == 75.0
 
     @pytest.mark.parametrize(
-        "capacity,max_power,min_power,efficiency",
+        "ev_battery_and_params",
         [
             (50.0, 150.0, 0.0, 0.95),
             (100.0, 250.0, 0, 0.9),
             (25.0, 75.0, 0, 1.0),
             (75.0, 200.0, 0, 0.85),
         ],
+        indirect=True,
     )
-    def test_evbattery_parametrized_initialization(
-        self, capacity, max_power, min_power, efficiency
-    ):
+    def test_evbattery_parametrized_initialization(self, ev_battery_and_params):
         """Test EVBattery initialization with various valid parameter combinations."""
-        ev_battery = EVBattery(
-            capacity=capacity,
-            max_charge_power=max_power,
-            min_charge_power=min_power,
-            efficiency=efficiency,
-        )
+        ev_battery, (capacity, max_power, min_power, efficiency) = ev_battery_and_params
 
         assert ev_battery.capacity == capacity
         assert ev_battery.max_charge_power == max_power
@@ -290,13 +384,11 @@ class TestEVBattery:
         energy_needed = ev_battery.energy_for_soc_change(current_soc=0.3, target_soc=0.8)
         # With 90% efficiency, need more energy than stored: 50 / 0.9 = 55.56 kWh
         expected_energy = (0.8 - 0.3) * 100.0 / 0.9
-        assert abs(energy_needed - expected_energy) < 0.1
+        assert energy_needed == pytest.approx(expected_energy, abs=0.1)
 
-    def test_evbattery_soc_boundary_conditions(self):
+    def test_evbattery_soc_boundary_conditions(self, default_ev_battery):
         """Test battery behavior at SOC boundaries (0% and 100%)."""
-        ev_battery = EVBattery(
-            capacity=100.0, max_charge_power=200.0, min_charge_power=0.0, efficiency=1.0
-        )
+        ev_battery = default_ev_battery
 
         # Test full charge from empty
         full_charge_energy = ev_battery.energy_for_soc_change(current_soc=0.0, target_soc=1.0)
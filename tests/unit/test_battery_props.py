@@ -0,0 +1,69 @@
+"""Property-based tests for Battery and EVBattery classes using Hypothesis."""
+
+import numpy as np
+from hypothesis import given, assume
+
+from elvis.battery import EVBattery
+from tests.unit._strategies import (
+    BATTERY_POOL,
+    _make_battery,
+    battery_params,
+    battery_pool_indices,
+    soc_values,
+)
+
+
+class TestBatteryProperties:
+    """Property-based tests for Battery and EVBattery classes."""
+
+    @given(battery_pool_indices)
+    def test_battery_power_bounds_invariant(self, index):
+        """Test that battery power is always within specified bounds."""
+        battery = BATTERY_POOL[index]
+
+        # Property: max_power_possible should never exceed max_charge_power
+        test_soc_values = [0.0, 0.25, 0.5, 0.75, 1.0]
+        powers = np.array([battery.max_power_possible(soc) for soc in test_soc_values])
+
+        assert (powers <= battery.max_charge_power).all(), (
+            f"Max powers {powers} exceed battery limit {battery.max_charge_power} "
+            f"at SOCs {test_soc_values}"
+        )
+        assert (powers >= 0).all(), f"Max powers {powers} are negative at SOCs {test_soc_values}"
+
+    @given(battery_params())
+    def test_battery_power_degradation_monotonic(self, params):
+        """Test that power degradation is monotonic (decreases with increasing SOC above threshold)."""
+        assume(params["start_power_degradation"] < 1.0)  # Need room for degradation
+
+        battery = _make_battery(**params)
+
+        # Property: Power should be non-increasing as SOC increases above start_power_degradation
+        soc_values = np.arange(params["start_power_degradation"], 1.0 + 1e-9, 0.05)
+        if soc_values.size < 2:
+            return
+
+        powers = np.fromiter(
+            (battery.max_power_possible(soc) for soc in soc_values),
+            dtype=float,
+            count=soc_values.size,
+        )
+
+        assert (np.diff(powers) <= 0).all(), f"Power increased along {powers} at SOCs {soc_values}"
+
+    @given(battery_pool_indices, soc_values)
+    def test_battery_min_power_invariant(self, index, soc):
+        """Test that minimum power is always consistent."""
+        battery = BATTERY_POOL[index]
+        min_power = battery.min_power_possible(soc)
+
+        # Property: Min power should always equal min_charge_power (for current implementation)
+        assert min_power == battery.min_charge_power
+
+    @given(battery_params())
+    def test_battery_to_dict_from_dict_roundtrip(self, params):
+        """Test that battery dictionary conversion is a perfect roundtrip."""
+        original_battery = _make_battery(**params)
+
+        # Property: All parameters should be identical
+        assert EVBattery.from_dict(**original_battery.to_dict()) == original_battery
@@ -10,16 +10,36 @@ Test coverage for distribution classes including:
 
 import pytest
 import math
-from unittest.mock import Mock
+
+import numpy as np
 
 from elvis.distribution import (
     Distribution,
     NormalDistribution,
     InterpolatedDistribution,
     EquallySpacedInterpolatedDistribution,
+    _linear_interpolation_batch,
 )
 
 
+@pytest.fixture(scope="module")
+def equally_spaced_pair():
+    """Regular and equally spaced linear distributions over the same equally spaced points."""
+    points = [(0.0, 1.0), (1.0, 3.0), (2.0, 2.0), (3.0, 4.0)]
+    bounds = {"x": {"min": 0.0, "max": 3.0}, "y": {"min": 1.0, "max": 4.0}}
+
+    return (
+        InterpolatedDistribution.linear(points, bounds),
+        EquallySpacedInterpolatedDistribution.linear(points, bounds),
+    )
+
+
+@pytest.fixture
+def without_numba(monkeypatch):
+    """Run at() on its pure-NumPy fallback, as when numba is not installed."""
+    monkeypatch.setattr("elvis.distribution._HAS_NUMBA", False)
+
+
 class TestDistribution:
     """Test cases for the base Distribution class."""
 
@@ -33,17 +53,13 @@ class TestDistribution:
         with pytest.raises(NotImplementedError):
             _ = dist.bounds
 
-    def test_distribution_property_methods_error(self):
-        """Test property methods fail when bounds not implemented."""
+    @pytest.mark.parametrize("name", ["min_x", "max_x", "min_y", "max_y"])
+    def test_distribution_property_methods_error(self, name):
+        """Test range properties raise NotImplementedError when bounds are not implemented."""
         dist = Distribution()
 
-        # These will fail because bounds is not implemented,
-        # but the actual error comes from using undefined 'bounds' variable
-        with pytest.raises(NameError):  # bounds variable not defined
-            _ = dist.min_x
-
-        with pytest.raises(NameError):
-            _ = dist.max_x
+        with pytest.raises(NotImplementedError):
+            getattr(dist, name)
 
 
 class TestNormalDistribution:
@@ -65,11 +81,11 @@ class TestNormalDistribution:
         # Test peak at mean (x=0)
         peak_value = normal[0.0]
         expected_peak = 1.0 / math.sqrt(2.0 * math.pi)
-        assert abs(peak_value - expected_peak) < 1e-10
+        assert peak_value == pytest.approx(expected_peak, abs=1e-10)
 
         # Test symmetry around mean
-        assert abs(normal[-1.0] - normal[1.0]) < 1e-10
-        assert abs(normal[-2.0] - normal[2.0]) < 1e-10
+        assert normal[-1.0] == pytest.approx(normal[1.0], abs=1e-10)
+        assert normal[-2.0] == pytest.approx(normal[2.0], abs=1e-10)
 
     def test_normal_distribution_custom_parameters(self):
         """Test normal distribution with custom mu and sigma."""
@@ -79,10 +95,10 @@ class TestNormalDistribution:
         # Test peak at mean (x=mu)
         peak_value = normal[mu]
         expected_peak = 1.0 / (sigma * math.sqrt(2.0 * math.pi))
-        assert abs(peak_value - expected_peak) < 1e-10
+        assert peak_value == pytest.approx(expected_peak, abs=1e-10)
 
         # Test symmetry around mean
-        assert abs(normal[mu - 1] - normal[mu + 1]) < 1e-10
+        assert normal[mu - 1] == pytest.approx(normal[mu + 1], abs=1e-10)
 
     def test_normal_distribution_bounds(self):
         """Test normal distribution bounds property."""
@@ -94,6 +110,15 @@ class TestNormalDistribution:
         assert bounds["y"]["min"] == 0
         assert bounds["y"]["max"] == 1
 
+    def test_normal_distribution_range_properties(self):
+        """Test range properties are read from the bounds."""
+        normal = NormalDistribution(0.0, 1.0)
+
+        assert normal.min_x == -math.inf
+        assert normal.max_x == math.inf
+        assert normal.min_y == 0
+        assert normal.max_y == 1
+
     def test_normal_distribution_probability_properties(self):
         """Test normal distribution maintains probability properties."""
         normal = NormalDistribution(0.0, 1.0)
@@ -102,6 +127,7 @@ class TestNormalDistribution:
         test_points = [-5, -2, -1, 0, 1, 2, 5]
         for x in test_points:
             assert normal[x] >= 0
+        assert (normal.at(test_points) >= 0).all()
 
         # Values should decrease as we move away from mean
         assert normal[0] > normal[1]
@@ -109,6 +135,18 @@ class TestNormalDistribution:
         assert normal[1] > normal[2]
         assert normal[-1] > normal[-2]
 
+    def test_normal_distribution_batch_lookup(self):
+        """Test batch evaluation matches scalar lookups."""
+        normal = NormalDistribution(5.0, 2.0)
+        xs = [-5, -2, -1, 0, 1, 2, 5, 7.5]
+
+        result = normal.at(xs)
+
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (len(xs),)
+        for value, x in zip(result, xs):
+            assert value == pytest.approx(normal[x], abs=1e-15)
+
     @pytest.mark.parametrize(
         "mu,sigma", [(0.0, 1.0), (1.0, 1.0), (0.0, 2.0), (5.0, 0.5), (-2.0, 3.0)]
     )
@@ -123,7 +161,7 @@ class TestNormalDistribution:
 
         # Test factor calculation
         expected_fac = 1.0 / (sigma * math.sqrt(2.0 * math.pi))
-        assert abs(normal.fac - expected_fac) < 1e-10
+        assert normal.fac == pytest.approx(expected_fac, abs=1e-10)
 
 
 class TestInterpolatedDistribution:
@@ -136,19 +174,22 @@ class TestInterpolatedDistribution:
 
     def test_interpolated_distribution_initialization(self):
         """Test InterpolatedDistribution initialization."""
-        mock_interpolate = Mock()
+
+        def mock_interpolate(y0, y1, offset):
+            return 0.0
+
         dist = InterpolatedDistribution(self.points, self.bounds, mock_interpolate)
 
         assert dist.points == self.points
-        assert dist._bounds == self.bounds
-        assert dist.interpolate == mock_interpolate
+        assert dist._bounds is self.bounds
+        assert dist.interpolate is mock_interpolate
 
     def test_interpolated_distribution_linear_constructor(self):
         """Test linear interpolation constructor."""
         dist = InterpolatedDistribution.linear(self.points, self.bounds)
 
         assert dist.points == self.points
-        assert dist._bounds == self.bounds
+        assert dist._bounds is self.bounds
         assert dist.interpolate == InterpolatedDistribution._linear_interpolation
 
     def test_linear_interpolation_method(self):
@@ -169,6 +210,16 @@ class TestInterpolatedDistribution:
         dist = InterpolatedDistribution.linear(self.points, self.bounds)
         assert dist.bounds == self.bounds
 
+    def test_interpolated_distribution_x_range(self):
+        """Test range properties are read from the bounds, not from the points."""
+        bounds = {"x": {"min": -1.0, "max": 5.0}, "y": {"min": 0.0, "max": 6.0}}
+        dist = InterpolatedDistribution.linear(self.points, bounds)
+
+        assert dist.min_x == -1.0
+        assert dist.max_x == 5.0
+        assert dist.min_y == 0.0
+        assert dist.max_y == 6.0
+
     def test_interpolated_distribution_below_range(self):
         """Test interpolation below range returns first point value."""
         dist = InterpolatedDistribution.linear(self.points, self.bounds)
@@ -187,7 +238,7 @@ class TestInterpolatedDistribution:
 
         for x, expected_y in self.points:
             result = dist[x]
-            assert abs(result - expected_y) < 1e-10
+            assert result == pytest.approx(expected_y, abs=1e-10)
 
     def test_interpolated_distribution_midpoints(self):
         """Test linear interpolation at midpoints."""
@@ -195,11 +246,11 @@ class TestInterpolatedDistribution:
 
         # Midpoint between (0,1) and (1,3) should be (0.5, 2)
         result = dist[0.5]
-        assert abs(result - 2.0) < 1e-10
+        assert result == pytest.approx(2.0, abs=1e-10)
 
         # Midpoint between (1,3) and (2,2) should be (1.5, 2.5)
         result = dist[1.5]
-        assert abs(result - 2.5) < 1e-10
+        assert result == pytest.approx(2.5, abs=1e-10)
 
     def test_interpolated_distribution_edge_interpolation(self):
         """Test interpolation at various offsets within segments."""
@@ -208,12 +259,62 @@ class TestInterpolatedDistribution:
         # Quarter point between (0,1) and (1,3)
         result = dist[0.25]
         expected = 1.0 + (3.0 - 1.0) * 0.25  # 1.5
-        assert abs(result - expected) < 1e-10
+        assert result == pytest.approx(expected, abs=1e-10)
 
         # Three-quarter point between (1,3) and (2,2)
         result = dist[1.75]
         expected = 3.0 + (2.0 - 3.0) * 0.75  # 2.25
-        assert abs(result - expected) < 1e-10
+        assert result == pytest.approx(expected, abs=1e-10)
+
+    def test_interpolated_distribution_batch_lookup(self):
+        """Test batch evaluation matches scalar lookups, including out of range values."""
+        dist = InterpolatedDistribution.linear(self.points, self.bounds)
+        xs = [-1.0, 0.0, 0.25, 0.5, 1.0, 1.5, 1.75, 3.0, 5.0]
+
+        result = dist.at(xs)
+
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (len(xs),)
+        assert result.tolist() == [dist[x] for x in xs]
+
+    def test_interpolated_distribution_batch_custom_interpolation(self):
+        """Test batch evaluation applies a non-linear interpolation function element-wise."""
+        dist = InterpolatedDistribution(self.points, self.bounds, lambda y0, y1, offset: y0)
+        xs = [-1.0, 0.5, 1.5, 2.5, 5.0]
+
+        assert dist.at(xs).tolist() == [dist[x] for x in xs]
+
+    @pytest.mark.usefixtures("without_numba")
+    def test_interpolated_distribution_batch_lookup_without_numba(self):
+        """Test the NumPy fallback matches scalar lookups, including out of range and NaN."""
+        dist = InterpolatedDistribution.linear(self.points, self.bounds)
+        xs = [-math.inf, -1.0, 0.0, 0.25, 1.5, 1.75, 2.999, 3.0, 5.0, math.inf, math.nan]
+
+        np.testing.assert_array_equal(dist.at(xs), [dist[x] for x in xs])
+
+    def test_interpolated_distribution_batch_nan(self):
+        """Test batch evaluation returns NaN for NaN like the scalar lookup does."""
+        dist = InterpolatedDistribution.linear(self.points, self.bounds)
+
+        result = dist.at([0.5, math.nan, 5.0])
+
+        assert math.isnan(dist[math.nan])
+        np.testing.assert_array_equal(result, [dist[0.5], math.nan, dist[5.0]])
+
+    def test_linear_interpolation_kernel_nan(self):
+        """Test the batch kernel never indexes past the points for a NaN key."""
+        xs = np.array([pt[0] for pt in self.points])
+        ys = np.array([pt[1] for pt in self.points])
+
+        result = _linear_interpolation_batch(np.array([math.nan, 0.5]), xs, ys)
+
+        np.testing.assert_array_equal(result, [math.nan, 2.0])
+
+    def test_interpolated_distribution_batch_single_point(self):
+        """Test batch evaluation of a single point distribution returns that value."""
+        dist = InterpolatedDistribution.linear([(1.0, 2.0)], {})
+
+        assert dist.at([0.0, 1.0, 2.0]).tolist() == [2.0, 2.0, 2.0]
 
 
 class TestEquallySpacedInterpolatedDistribution:
@@ -226,20 +327,23 @@ class TestEquallySpacedInterpolatedDistribution:
 
     def test_equally_spaced_distribution_initialization(self):
         """Test EquallySpacedInterpolatedDistribution initialization."""
-        mock_interpolate = Mock()
+
+        def mock_interpolate(y0, y1, offset):
+            return 0.0
+
         dist = EquallySpacedInterpolatedDistribution(self.points, self.bounds, mock_interpolate)
 
-        assert dist.points == self.points
-        assert dist._bounds == self.bounds
-        assert dist.interpolate == mock_interpolate
+        assert dist.points is self.points
+        assert dist._bounds is self.bounds
+        assert dist.interpolate is mock_interpolate
         assert dist.distance_between_points == 1.0
 
     def test_equally_spaced_distribution_linear_constructor(self):
         """Test linear interpolation constructor."""
         dist = EquallySpacedInterpolatedDistribution.linear(self.points, self.bounds)
 
-        assert dist.points == self.points
-        assert dist._bounds == self.bounds
+        assert dist.points is self.points
+        assert dist._bounds is self.bounds
         assert dist.interpolate == InterpolatedDistribution._linear_interpolation
         assert dist.distance_between_points == 1.0
 
@@ -260,6 +364,16 @@ class TestEquallySpacedInterpolatedDistribution:
         dist = EquallySpacedInterpolatedDistribution.linear(self.points, self.bounds)
         assert dist.bounds == self.bounds
 
+    def test_equally_spaced_x_range(self):
+        """Test range properties are read from the bounds, not from the points."""
+        bounds = {"x": {"min": -1.0, "max": 5.0}, "y": {"min": 0.0, "max": 6.0}}
+        dist = EquallySpacedInterpolatedDistribution.linear(self.points, bounds)
+
+        assert dist.min_x == -1.0
+        assert dist.max_x == 5.0
+        assert dist.min_y == 0.0
+        assert dist.max_y == 6.0
+
     def test_equally_spaced_below_range(self):
         """Test interpolation below range returns first point value."""
         dist = EquallySpacedInterpolatedDistribution.linear(self.points, self.bounds)
@@ -278,7 +392,7 @@ class TestEquallySpacedInterpolatedDistribution:
 
         for x, expected_y in self.points:
             result = dist[x]
-            assert abs(result - expected_y) < 1e-10
+            assert result == pytest.approx(expected_y, abs=1e-10)
 
     def test_equally_spaced_midpoints(self):
         """Test linear interpolation at midpoints."""
@@ -286,27 +400,65 @@ class TestEquallySpacedInterpolatedDistribution:
 
         # Midpoint between (0,1) and (1,3) should be (0.5, 2)
         result = dist[0.5]
-        assert abs(result - 2.0) < 1e-10
+        assert result == pytest.approx(2.0, abs=1e-10)
 
         # Midpoint between (1,3) and (2,2) should be (1.5, 2.5)
         result = dist[1.5]
-        assert abs(result - 2.5) < 1e-10
-
-    def test_equally_spaced_optimized_index_calculation(self):
-        """Test that equally spaced version efficiently calculates indices."""
-        dist = EquallySpacedInterpolatedDistribution.linear(self.points, self.bounds)
+        assert result == pytest.approx(2.5, abs=1e-10)
 
-        # Test various points and verify they produce correct results
-        test_cases = [
+    @pytest.mark.parametrize(
+        "x,expected_y",
+        [
             (0.25, 1.5),  # In first segment
             (0.75, 2.5),  # In first segment
             (1.25, 2.75),  # In second segment
             (2.25, 2.5),  # In third segment
-        ]
+        ],
+    )
+    def test_equally_spaced_optimized_index_calculation(self, equally_spaced_pair, x, expected_y):
+        """Test that equally spaced version efficiently calculates indices."""
+        _, dist = equally_spaced_pair
 
-        for x, expected_y in test_cases:
-            result = dist[x]
-            assert abs(result - expected_y) < 1e-10
+        assert dist[x] == pytest.approx(expected_y, abs=1e-10)
+
+    def test_equally_spaced_batch_lookup(self):
+        """Test batch evaluation matches scalar lookups, including out of range values."""
+        dist = EquallySpacedInterpolatedDistribution.linear(self.points, self.bounds)
+        xs = [-1.0, 0.0, 0.25, 0.75, 1.0, 1.25, 2.25, 2.999, 3.0, 5.0]
+
+        result = dist.at(xs)
+
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (len(xs),)
+        assert result.tolist() == [dist[x] for x in xs]
+
+    def test_equally_spaced_batch_custom_interpolation(self):
+        """Test batch evaluation applies a non-linear interpolation function element-wise."""
+        dist = EquallySpacedInterpolatedDistribution(
+            self.points, self.bounds, lambda y0, y1, offset: y1
+        )
+        xs = [-1.0, 0.5, 1.5, 2.5, 5.0]
+
+        assert dist.at(xs).tolist() == [dist[x] for x in xs]
+
+    @pytest.mark.usefixtures("without_numba")
+    def test_equally_spaced_batch_lookup_without_numba(self):
+        """Test the NumPy fallback matches scalar lookups, and rejects NaN like them."""
+        dist = EquallySpacedInterpolatedDistribution.linear(self.points, self.bounds)
+        xs = [-math.inf, -1.0, 0.0, 0.25, 1.25, 2.25, 2.999, 3.0, 5.0, math.inf]
+
+        assert dist.at(xs).tolist() == [dist[x] for x in xs]
+        with pytest.raises(ValueError):
+            dist[math.nan]
+        with pytest.raises(ValueError, match="NaN"):
+            dist.at([0.5, math.nan])
+
+    def test_equally_spaced_batch_nan_rejected(self):
+        """Test batch evaluation rejects NaN like the scalar lookup does."""
+        dist = EquallySpacedInterpolatedDistribution.linear(self.points, self.bounds)
+
+        with pytest.raises(ValueError, match="NaN"):
+            dist.at([0.5, math.nan])
 
     def test_equally_spaced_with_fractional_spacing(self):
         """Test equally spaced distribution with fractional spacing."""
@@ -318,7 +470,7 @@ class TestEquallySpacedInterpolatedDistribution:
         # Test interpolation
         result = dist[0.125]  # Midpoint of first segment
         expected = 1.0 + (2.0 - 1.0) * 0.5  # 1.5
-        assert abs(result - expected) < 1e-10
+        assert result == pytest.approx(expected, abs=1e-10)
 
     @pytest.mark.parametrize("spacing,num_points", [(1.0, 5), (0.5, 9), (2.0, 3), (0.1, 11)])
     def test_equally_spaced_parametrized_spacing(self, spacing, num_points):
@@ -332,31 +484,23 @@ class TestEquallySpacedInterpolatedDistribution:
 
         dist = EquallySpacedInterpolatedDistribution.linear(points, bounds)
 
-        assert abs(dist.distance_between_points - spacing) < 1e-10
+        assert dist.distance_between_points == pytest.approx(spacing, abs=1e-10)
 
         # Test that exact points work
         for x, expected_y in points:
             result = dist[x]
-            assert abs(result - expected_y) < 1e-10
+            assert result == pytest.approx(expected_y, abs=1e-10)
 
 
 class TestDistributionIntegration:
     """Integration tests comparing different distribution implementations."""
 
-    def test_interpolated_vs_equally_spaced_same_results(self):
+    @pytest.mark.parametrize("x", [0.0, 0.3, 0.7, 1.0, 1.2, 1.8, 2.0, 2.5, 3.0])
+    def test_interpolated_vs_equally_spaced_same_results(self, equally_spaced_pair, x):
         """Test that both interpolation methods give same results for equally spaced data."""
-        points = [(0.0, 1.0), (1.0, 3.0), (2.0, 2.0), (3.0, 4.0)]
-        bounds = {"x": {"min": 0.0, "max": 3.0}, "y": {"min": 1.0, "max": 4.0}}
+        regular_dist, equally_spaced_dist = equally_spaced_pair
 
-        regular_dist = InterpolatedDistribution.linear(points, bounds)
-        equally_spaced_dist = EquallySpacedInterpolatedDistribution.linear(points, bounds)
-
-        # Test same results at various points
-        test_points = [0.0, 0.3, 0.7, 1.0, 1.2, 1.8, 2.0, 2.5, 3.0]
-        for x in test_points:
-            regular_result = regular_dist[x]
-            equally_spaced_result = equally_spaced_dist[x]
-            assert abs(regular_result - equally_spaced_result) < 1e-10
+        assert regular_dist[x] == pytest.approx(equally_spaced_dist[x], abs=1e-10)
 
     def test_distribution_inheritance_hierarchy(self):
         """Test that all distribution classes properly inherit from Distribution."""
@@ -0,0 +1,55 @@
+"""Property-based tests for distribution classes using Hypothesis."""
+
+import math
+
+import numpy as np
+from hypothesis import given, strategies as st
+
+from elvis.distribution import InterpolatedDistribution
+from tests.unit._strategies import _normal_distribution, interp_points
+
+
+class TestDistributionProperties:
+    """Property-based tests for distribution classes."""
+
+    @given(
+        st.floats(min_value=-100, max_value=100, allow_nan=False, allow_infinity=False),
+        st.floats(min_value=0.1, max_value=10, allow_nan=False, allow_infinity=False),
+    )
+    def test_normal_distribution_properties(self, mu, sigma):
+        """Test mathematical properties of normal distribution."""
+        normal = _normal_distribution(mu, sigma)
+
+        # Property 1: Peak at mean
+        nearby_left, peak_value, nearby_right = normal.at([mu - 0.01, mu, mu + 0.01])
+
+        assert peak_value >= nearby_left
+        assert peak_value >= nearby_right
+
+        # Property 2: Symmetry around mean
+        offset = min(sigma * 2, 10)  # Test within reasonable range
+        left_value, right_value = normal.at([mu - offset, mu + offset])
+        assert math.isclose(left_value, right_value, rel_tol=1e-12, abs_tol=1e-10)
+
+        # Property 3: All values non-negative
+        test_points = [mu - 3 * sigma, mu - sigma, mu, mu + sigma, mu + 3 * sigma]
+        assert (normal.at(test_points) >= 0).all()
+
+    @given(interp_points())
+    def test_interpolated_distribution_bounds(self, points_and_bounds):
+        """Test that interpolated distribution respects input bounds."""
+        points, bounds = points_and_bounds
+        x_values = [x for x, _ in points]
+        y_values = [y for _, y in points]
+
+        dist = InterpolatedDistribution.linear(points, bounds)
+
+        # Property 1: Values outside range return boundary values
+        far_left = x_values[0] - 100
+        far_right = x_values[-1] + 100
+
+        assert dist[far_left] == y_values[0]
+        assert dist[far_right] == y_values[-1]
+
+        # Property 2: Exact points return exact values
+        np.testing.assert_allclose(dist.at(x_values), y_values, rtol=0, atol=1e-10)
@@ -8,10 +8,36 @@ Test coverage for physical unit classes including:
 - Unit consistency and integration
 """
 
+import numpy as np
 import pytest
 from elvis.units import Power, Current, Charge, Energy
 
 
+# Reference unit instances shared by the whole session; tests must not mutate them
+@pytest.fixture(scope="session")
+def tesla_pack_energy():
+    """Tesla Model 3 Long Range battery capacity, 75000 Wh."""
+    return Energy(75000.0)
+
+
+@pytest.fixture(scope="session")
+def dc_fast_charging_current():
+    """DC fast charging current of 125 A."""
+    return Current(125.0)
+
+
+@pytest.fixture(scope="session")
+def reference_power():
+    """Reference power of 1500 W."""
+    return Power(1500.0)
+
+
+@pytest.fixture(scope="session")
+def reference_current():
+    """Reference current of 10 A."""
+    return Current(10.0)
+
+
 class TestPower:
     """Test cases for the Power class."""
 
@@ -20,26 +46,26 @@ class TestPower:
         power = Power(1500.0)  # 1500 watts
         assert power.watts == 1500.0
 
-    def test_power_kilowatts_conversion(self):
-        """Test watts to kilowatts conversion."""
-        # Test various power values
-        test_cases = [
+    @pytest.mark.parametrize(
+        "watts,expected_kw",
+        [
             (1000.0, 1.0),  # 1000W = 1kW
             (1500.0, 1.5),  # 1500W = 1.5kW
             (500.0, 0.5),  # 500W = 0.5kW
             (2300.0, 2.3),  # 2300W = 2.3kW
             (0.0, 0.0),  # 0W = 0kW
-        ]
-
-        for watts, expected_kw in test_cases:
-            power = Power(watts)
-            assert abs(power.kilowatts - expected_kw) < 1e-10
+        ],
+    )
+    def test_power_kilowatts_conversion(self, watts, expected_kw):
+        """Test watts to kilowatts conversion."""
+        power = Power(watts)
+        assert power.kilowatts == pytest.approx(expected_kw, abs=1e-10)
 
     def test_power_fractional_watts(self):
         """Test Power with fractional watt values."""
         power = Power(123.456)
         assert power.watts == 123.456
-        assert abs(power.kilowatts - 0.123456) < 1e-10
+        assert power.kilowatts == pytest.approx(0.123456, abs=1e-10)
 
     def test_power_negative_values(self):
         """Test Power with negative values (e.g., discharging)."""
@@ -52,7 +78,7 @@ class TestPower:
         """Test Power conversions with various values."""
         power = Power(watts)
         assert power.watts == watts
-        assert abs(power.kilowatts - watts / 1000.0) < 1e-10
+        assert power.kilowatts == pytest.approx(watts / 1000.0, abs=1e-10)
 
 
 class TestCurrent:
@@ -63,19 +89,20 @@ class TestCurrent:
         current = Current(10.5)  # 10.5 amps
         assert current.amps == 10.5
 
-    def test_current_milliamps_conversion(self):
-        """Test amps to milliamps conversion."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "amps,expected_milliamps",
+        [
             (1.0, 1000.0),  # 1A = 1000mA
             (0.5, 500.0),  # 0.5A = 500mA
             (0.001, 1.0),  # 0.001A = 1mA
             (2.5, 2500.0),  # 2.5A = 2500mA
             (0.0, 0.0),  # 0A = 0mA
-        ]
-
-        for amps, expected_milliamps in test_cases:
-            current = Current(amps)
-            assert abs(current.milliamps - expected_milliamps) < 1e-10
+        ],
+    )
+    def test_current_milliamps_conversion(self, amps, expected_milliamps):
+        """Test amps to milliamps conversion."""
+        current = Current(amps)
+        assert current.milliamps == pytest.approx(expected_milliamps, abs=1e-10)
 
     def test_current_charge_multiplication(self):
         """Test current multiplication to create charge (amp-hours)."""
@@ -127,7 +154,7 @@ class TestCurrent:
         """Test current multiplication with various parameter combinations."""
         current = Current(amps)
         charge = current * hours
-        assert abs(charge.amp_hours - expected_charge) < 1e-10
+        assert charge.amp_hours == pytest.approx(expected_charge, abs=1e-10)
 
 
 class TestCharge:
@@ -138,23 +165,23 @@ class TestCharge:
         charge = Charge(15.5)  # 15.5 amp-hours
         assert charge.amp_hours == 15.5
 
-    def test_charge_energy_conversion(self):
-        """Test charge to energy conversion at given voltage."""
-        charge = Charge(10.0)  # 10 Ah
-
-        # Convert to energy at various voltages
-        test_cases = [
+    @pytest.mark.parametrize(
+        "voltage,expected_wh",
+        [
             (12.0, 120.0),  # 10Ah × 12V = 120Wh
             (24.0, 240.0),  # 10Ah × 24V = 240Wh
             (400.0, 4000.0),  # 10Ah × 400V = 4000Wh
             (1.0, 10.0),  # 10Ah × 1V = 10Wh
-        ]
+        ],
+    )
+    def test_charge_energy_conversion(self, voltage, expected_wh):
+        """Test charge to energy conversion at given voltage."""
+        charge = Charge(10.0)  # 10 Ah
 
-        for voltage, expected_wh in test_cases:
-            energy = charge.energy(voltage)
-            assert isinstance(energy, Energy)
-            # Energy class stores in Wh, not kWh
-            assert abs(energy.kwh - expected_wh) < 1e-10
+        energy = charge.energy(voltage)
+        assert isinstance(energy, Energy)
+        # Energy class stores in Wh, not kWh
+        assert energy.kwh == pytest.approx(expected_wh, abs=1e-10)
 
     def test_charge_energy_zero_values(self):
         """Test charge to energy conversion with zero values."""
@@ -193,7 +220,7 @@ class TestCharge:
         """Test charge to energy conversion with various parameters."""
         charge = Charge(amp_hours)
         energy = charge.energy(voltage)
-        assert abs(energy.kwh - expected_kwh) < 1e-10
+        assert energy.kwh == pytest.approx(expected_kwh, abs=1e-10)
 
 
 class TestEnergy:
@@ -204,22 +231,22 @@ class TestEnergy:
         energy = Energy(5750.0)  # 5750 Wh (stored as Wh, not kWh)
         assert energy.kwh == 5750.0
 
-    def test_energy_charge_conversion(self):
-        """Test energy to charge conversion at given voltage."""
-        energy = Energy(2400.0)  # 2400 Wh
-
-        # Convert to charge at various voltages
-        test_cases = [
+    @pytest.mark.parametrize(
+        "voltage,expected_ah",
+        [
             (12.0, 200.0),  # 2400Wh ÷ 12V = 200Ah
             (24.0, 100.0),  # 2400Wh ÷ 24V = 100Ah
             (400.0, 6.0),  # 2400Wh ÷ 400V = 6Ah
             (1.0, 2400.0),  # 2400Wh ÷ 1V = 2400Ah
-        ]
+        ],
+    )
+    def test_energy_charge_conversion(self, voltage, expected_ah):
+        """Test energy to charge conversion at given voltage."""
+        energy = Energy(2400.0)  # 2400 Wh
 
-        for voltage, expected_ah in test_cases:
-            charge = energy.charge(voltage)
-            assert isinstance(charge, Charge)
-            assert abs(charge.amp_hours - expected_ah) < 1e-10
+        charge = energy.charge(voltage)
+        assert isinstance(charge, Charge)
+        assert charge.amp_hours == pytest.approx(expected_ah, abs=1e-10)
 
     def test_energy_charge_zero_energy(self):
         """Test energy to charge conversion with zero energy."""
@@ -240,12 +267,12 @@ class TestEnergy:
         # Negative energy
         energy = Energy(-1200.0)  # -1200 Wh
         charge = energy.charge(12.0)
-        assert abs(charge.amp_hours - (-100.0)) < 1e-10  # -1200Wh ÷ 12V = -100Ah
+        assert charge.amp_hours == pytest.approx(-100.0, abs=1e-10)  # -1200Wh ÷ 12V = -100Ah
 
         # Negative voltage
         energy_pos = Energy(1200.0)
         charge_neg_v = energy_pos.charge(-12.0)
-        assert abs(charge_neg_v.amp_hours - (-100.0)) < 1e-10
+        assert charge_neg_v.amp_hours == pytest.approx(-100.0, abs=1e-10)
 
     @pytest.mark.parametrize(
         "wh,voltage,expected_ah",
@@ -260,7 +287,8 @@ class TestEnergy:
         """Test energy to charge conversion with various parameters."""
         energy = Energy(wh)
         charge = energy.charge(voltage)
-        assert abs(charge.amp_hours - expected_ah) < 1e-6  # Allow small floating point errors
+        # Expected values are rounded to six decimals
+        assert charge.amp_hours == pytest.approx(expected_ah, abs=1e-6)
 
 
 class TestUnitsIntegration:
@@ -281,15 +309,14 @@ class TestUnitsIntegration:
         # Energy → Charge (should get back same charge)
         charge2 = energy.charge(voltage)  # 120Wh ÷ 12V = 10Ah
 
-        assert abs(charge1.amp_hours - charge2.amp_hours) < 1e-10
+        assert charge1.amp_hours == pytest.approx(charge2.amp_hours, abs=1e-10)
 
-    def test_power_units_independence(self):
+    def test_power_units_independence(self, reference_power, reference_current):
         """Test that Power units operate independently from other units."""
-        power = Power(1500.0)  # 1.5 kW
+        power = reference_power  # 1.5 kW
 
         # Power should not interfere with other unit calculations
-        current = Current(10.0)
-        charge = current * 1.0  # 10 Ah
+        charge = reference_current * 1.0  # 10 Ah
         energy = charge.energy(400.0)  # 4 kWh
 
         # Original power should be unchanged
@@ -315,53 +342,82 @@ class TestUnitsIntegration:
         # Power should remain Power type
         assert isinstance(power, Power)
 
-    def test_realistic_ev_battery_scenario(self):
+    def test_realistic_ev_battery_scenario(self, tesla_pack_energy, dc_fast_charging_current):
         """Test units with realistic EV battery scenario."""
         # Tesla Model 3 Long Range approximate specs
-        battery_capacity = Energy(75000.0)  # 75000 Wh (75 kWh)
+        battery_capacity = tesla_pack_energy  # 75000 Wh (75 kWh)
         battery_voltage = 400.0  # 400V nominal
-        charging_current = Current(125.0)  # 125A DC fast charging
+        charging_current = dc_fast_charging_current  # 125A DC fast charging
 
         # Calculate battery capacity in Ah
         battery_ah = battery_capacity.charge(battery_voltage)
-        assert abs(battery_ah.amp_hours - 187.5) < 1e-10  # 75000Wh ÷ 400V = 187.5Ah
+        assert battery_ah.amp_hours == pytest.approx(187.5, abs=1e-10)  # 75000Wh ÷ 400V = 187.5Ah
 
         # Calculate charging time for 50% capacity
         half_capacity_ah = Charge(battery_ah.amp_hours * 0.5)  # 93.75 Ah
         charging_time_hours = half_capacity_ah.amp_hours / charging_current.amps
-        assert abs(charging_time_hours - 0.75) < 1e-10  # 0.75 hours = 45 minutes
+        assert charging_time_hours == pytest.approx(0.75, abs=1e-10)  # 0.75 hours = 45 minutes
 
         # Verify energy equivalence
         half_energy = half_capacity_ah.energy(battery_voltage)
-        assert abs(half_energy.kwh - 37500.0) < 1e-10  # 37500 Wh
+        assert half_energy.kwh == pytest.approx(37500.0, abs=1e-10)  # 37500 Wh
+
+    @pytest.mark.parametrize(
+        "amp_hours,voltage,expected_energy",
+        [
+            (10.0, 12.0, 120.0),  # 10Ah × 12V = 120Wh
+            (-2.5, 48.0, -120.0),  # -2.5Ah × 48V = -120Wh
+            (93.75, 400.0, 37500.0),  # 93.75Ah × 400V = 37500Wh
+            (62.5, 800.0, 50000.0),  # 62.5Ah × 800V = 50000Wh
+            (0.0, 400.0, 0.0),
+        ],
+    )
+    def test_charge_energy_conversion_known_values(self, amp_hours, voltage, expected_energy):
+        """Test charge → energy → charge against hand-computed energies."""
+        energy = Charge(amp_hours).energy(voltage)
+
+        assert energy.kwh == pytest.approx(expected_energy, abs=1e-9)
+        assert energy.charge(voltage).amp_hours == pytest.approx(amp_hours, abs=1e-9)
+
+    @pytest.mark.parametrize("voltage", [12.0, 48.0, 400.0, 800.0])
+    def test_charge_energy_roundtrip_is_identity(self, voltage):
+        """Test the charge → energy → charge roundtrip returns the input over a sweep."""
+        amp_hours = np.linspace(-500.0, 500.0, 1001)
+
+        actual = np.array(
+            [Charge(ah).energy(voltage).charge(voltage).amp_hours for ah in amp_hours]
+        )
+
+        np.testing.assert_allclose(actual, amp_hours, rtol=1e-12, atol=1e-12)
 
     def test_unit_precision_consistency(self):
         """Test that unit conversions maintain precision."""
         # High precision values
         precise_power = Power(1234.56789)
-        assert abs(precise_power.kilowatts - 1.23456789) < 1e-10
+        assert precise_power.kilowatts == pytest.approx(1.23456789, abs=1e-10)
 
         precise_current = Current(12.3456)
-        assert abs(precise_current.milliamps - 12345.6) < 1e-10
+        assert precise_current.milliamps == pytest.approx(12345.6, abs=1e-10)
 
         precise_charge = Charge(98.7654321)
         precise_energy = precise_charge.energy(123.456)
         expected_wh = 98.7654321 * 123.456  # Result in Wh, not kWh
-        assert abs(precise_energy.kwh - expected_wh) < 1e-10
+        assert precise_energy.kwh == pytest.approx(expected_wh, abs=1e-10)
 
-    @pytest.mark.parametrize("base_value", [0.001, 1.0, 100.0, 1000.0, 10000.0])
-    def test_units_scale_invariance(self, base_value):
+    def test_units_scale_invariance(self):
         """Test that unit relationships hold across different scales."""
+        base_values = np.array([0.001, 1.0, 100.0, 1000.0, 10000.0])
+
         # Power scaling
-        power = Power(base_value)
-        assert power.kilowatts == base_value / 1000.0
+        kilowatts = np.array([Power(v).kilowatts for v in base_values])
+        np.testing.assert_array_equal(kilowatts, base_values / 1000.0)
 
         # Current scaling
-        current = Current(base_value)
-        assert current.milliamps == base_value * 1000.0
-
-        # Charge-Energy consistency
-        charge = Charge(base_value)
-        energy = charge.energy(1.0)  # 1V for simple conversion
-        back_to_charge = energy.charge(1.0)
-        assert abs(back_to_charge.amp_hours - base_value) < 1e-10
+        milliamps = np.array([Current(v).milliamps for v in base_values])
+        np.testing.assert_array_equal(milliamps, base_values * 1000.0)
+
+        # Charge-Energy consistency, 1V for simple conversion
+        back_to_charge = np.array(
+            [Charge(v).energy(1.0).charge(1.0).amp_hours for v in base_values]
+        )
+        np.testing.assert_allclose(back_to_charge, base_values, rtol=0, atol=1e-10)
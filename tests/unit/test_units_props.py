@@ -0,0 +1,102 @@
+"""Property-based tests for unit conversion classes using Hypothesis."""
+
+import math
+from functools import lru_cache
+
+from hypothesis import given, strategies as st
+
+from elvis.units import Power, Current, Charge, Energy
+from tests.unit._strategies import unit_settings
+
+# Unit objects are never mutated by these tests, so replayed values can share one instance
+_Power = lru_cache(maxsize=256)(Power)
+_Current = lru_cache(maxsize=256)(Current)
+_Charge = lru_cache(maxsize=256)(Charge)
+_Energy = lru_cache(maxsize=256)(Energy)
+
+
+class TestUnitsProperties:
+    """Property-based tests for unit conversion classes."""
+
+    @unit_settings
+    @given(st.floats(min_value=-1000000, max_value=1000000, allow_nan=False, allow_infinity=False))
+    def test_power_unit_conversion_consistent(self, watts):
+        """Test that power unit conversions are mathematically consistent."""
+        power = _Power(watts)
+
+        # Property: Converting back and forth should give original value
+        kilowatts = power.kilowatts
+        watts_back = kilowatts * 1000.0
+
+        assert math.isclose(watts_back, watts, rel_tol=1e-12, abs_tol=1e-12)
+
+    @unit_settings
+    @given(st.floats(min_value=-1000, max_value=1000, allow_nan=False, allow_infinity=False))
+    def test_current_unit_conversion_consistent(self, amps):
+        """Test that current unit conversions are mathematically consistent."""
+        current = _Current(amps)
+
+        # Property: Converting back and forth should give original value
+        milliamps = current.milliamps
+        amps_back = milliamps / 1000.0
+
+        assert math.isclose(amps_back, amps, rel_tol=1e-12, abs_tol=1e-12)
+
+    @unit_settings
+    @given(
+        st.floats(min_value=-1000, max_value=1000, allow_nan=False, allow_infinity=False),
+        st.floats(min_value=0.1, max_value=100, allow_nan=False, allow_infinity=False),
+    )
+    def test_current_charge_multiplication_commutative(self, amps, hours):
+        """Test that current × time = charge is mathematically correct."""
+        current = _Current(amps)
+        charge = current * hours
+
+        # Property: amp-hours should equal amps × hours exactly
+        expected_ah = amps * hours
+        assert math.isclose(charge.amp_hours, expected_ah, rel_tol=1e-12, abs_tol=1e-12)
+
+    @unit_settings
+    @given(
+        st.floats(min_value=-10000, max_value=10000, allow_nan=False, allow_infinity=False),
+        st.floats(min_value=1, max_value=1000, allow_nan=False, allow_infinity=False),
+    )
+    def test_charge_energy_conversion_reciprocal(self, amp_hours, voltage):
+        """Test that charge ↔ energy conversions are reciprocal."""
+        charge = _Charge(amp_hours)
+        energy = charge.energy(voltage)
+        charge_back = energy.charge(voltage)
+
+        # Property: Roundtrip conversion should preserve original value
+        assert math.isclose(charge_back.amp_hours, amp_hours, rel_tol=1e-12, abs_tol=1e-12)
+
+    @unit_settings
+    @given(
+        st.floats(min_value=-100000, max_value=100000, allow_nan=False, allow_infinity=False),
+        st.floats(min_value=1, max_value=1000, allow_nan=False, allow_infinity=False),
+    )
+    def test_energy_charge_conversion_reciprocal(self, watt_hours, voltage):
+        """Test that energy ↔ charge conversions are reciprocal."""
+        energy = _Energy(watt_hours)
+        charge = energy.charge(voltage)
+        energy_back = charge.energy(voltage)
+
+        # Property: Roundtrip conversion should preserve original value
+        assert math.isclose(energy_back.kwh, watt_hours, rel_tol=1e-12, abs_tol=1e-12)
+
+    @unit_settings
+    @given(
+        st.floats(min_value=-1000, max_value=1000, allow_nan=False, allow_infinity=False),
+        st.floats(min_value=0.1, max_value=100, allow_nan=False, allow_infinity=False),
+        st.floats(min_value=1, max_value=1000, allow_nan=False, allow_infinity=False),
+    )
+    def test_units_energy_conservation(self, amps, hours, voltage):
+        """Test energy conservation through unit conversions."""
+        # Current → Charge → Energy calculation
+        current = _Current(amps)
+        charge = current * hours  # amp-hours
+        energy = charge.energy(voltage)  # watt-hours
+
+        # Property: Energy should equal amps × hours × voltage
+        expected_energy = amps * hours * voltage
+        assert math.isclose(energy.kwh, expected_energy, rel_tol=1e-12, abs_tol=1e-12)
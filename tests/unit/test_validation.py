@@ -6,6 +6,9 @@ from elvis.config.validation import ConfigValidator, ValidationResult
 from elvis.enums import SchedulingPolicyType, SampleMethod
 from elvis.exceptions import InvalidParameterError
 
+# A week of hourly arrival probabilities with one peak
+_VALID_ARRIVAL_DIST = tuple([0.0] * 168 + [1.0])
+
 
 class TestConfigValidator:
     """Test the ConfigValidator functionality."""
@@ -69,7 +72,7 @@ class TestConfigValidator:
 
     def test_validate_arrival_distribution_valid(self):
         """Test valid arrival distributions are accepted."""
-        valid_dist = [0.0] * 168 + [1.0]  # One peak
+        valid_dist = list(_VALID_ARRIVAL_DIST)
         result = ConfigValidator.validate_arrival_distribution(valid_dist)
         assert result == valid_dist
 
@@ -88,35 +91,50 @@ class TestConfigValidator:
             ConfigValidator.validate_arrival_distribution([0.5, 1.5])  # 1.5 > 1
 
 
+# Results are built once per class; the tests below only read them
+@pytest.fixture(scope="class")
+def valid_result():
+    """Validation result without errors or warnings."""
+    return ValidationResult()
+
+
+@pytest.fixture(scope="class")
+def error_result():
+    """Validation result holding a single error."""
+    result = ValidationResult()
+    result.add_error(InvalidParameterError("test_param", "invalid_value", "test reason"))
+    return result
+
+
+@pytest.fixture(scope="class")
+def warning_result():
+    """Validation result holding a single warning."""
+    result = ValidationResult()
+    result.add_warning("Test warning message")
+    return result
+
+
 class TestValidationResult:
     """Test the ValidationResult functionality."""
 
-    def test_validation_result_valid(self):
+    def test_validation_result_valid(self, valid_result):
         """Test validation result for valid configuration."""
-        result = ValidationResult()
-        assert result.is_valid
-        assert len(result.errors) == 0
-        assert len(result.warnings) == 0
-        assert "No validation errors" in result.get_error_summary()
+        assert valid_result.is_valid
+        assert len(valid_result.errors) == 0
+        assert len(valid_result.warnings) == 0
+        assert "No validation errors" in valid_result.get_error_summary()
 
-    def test_validation_result_with_errors(self):
+    def test_validation_result_with_errors(self, error_result):
         """Test validation result with errors."""
-        result = ValidationResult()
-        error = InvalidParameterError("test_param", "invalid_value", "test reason")
-        result.add_error(error)
+        assert not error_result.is_valid
+        assert len(error_result.errors) == 1
+        assert "Validation errors (1)" in error_result.get_error_summary()
 
-        assert not result.is_valid
-        assert len(result.errors) == 1
-        assert "Validation errors (1)" in result.get_error_summary()
-
-    def test_validation_result_with_warnings(self):
+    def test_validation_result_with_warnings(self, warning_result):
         """Test validation result with warnings."""
-        result = ValidationResult()
-        result.add_warning("Test warning message")
-
-        assert result.is_valid  # Warnings don't make config invalid
-        assert len(result.warnings) == 1
-        assert result.warnings[0] == "Test warning message"
+        assert warning_result.is_valid  # Warnings don't make config invalid
+        assert len(warning_result.warnings) == 1
+        assert warning_result.warnings[0] == "Test warning message"
 
 
 class TestEnumIntegration: